@@ -0,0 +1,128 @@
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+from SQLiteORM import SQLiteORM
+
+
+class AsyncSQLiteORM:
+
+    """
+    asyncio front end for SQLiteORM: every call runs on executor threads so the
+    event loop (Flet, aiohttp...) never blocks on disk I/O.
+    - writes, transactions and the single connection mode: one dedicated writer thread (calls are queued in order)
+    - pool_size=N: reads run on N reader threads against the connection pool
+
+    async with AsyncSQLiteORM("productos.db", pool_size=4) as db:
+        rows = await db.execute("SELECT * FROM productos WHERE price > ?", (10,))
+        async for row in db.iter("SELECT * FROM productos", batch_size=5000): ...
+    """
+
+    def __init__(self, db_path: str, pool_size: Union[int, None] = None):
+
+        self.orm = SQLiteORM(db_path)
+        self.pool_size = pool_size
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="orm-writer")
+        self.readers = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="orm-reader") if pool_size else None
+
+    async def __aenter__(self):
+
+        if not await self.connect():
+            raise ConnectionError(f"It could not be connected to {self.orm.db_path}")
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+
+        await self.close()
+
+    async def run(self, fn, *args, read: bool = False, **kwargs):
+
+        """
+        Run any blocking callable on the ORM threads:
+        await db.run(lambda: db.orm.table("tasks").where(id_user=3).all(), read=True)
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.readers if read and self.readers is not None else self.writer
+        return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+    async def connect(self):
+
+        if self.pool_size:
+            return await self.run(self.orm.connect_pool, self.pool_size)
+        return await self.run(self.orm.connect_DB)
+
+    async def close(self) -> None:
+
+        try:
+            await self.run(self.orm.close_connection)
+        finally:
+            self.writer.shutdown(wait=False)
+            if self.readers is not None:
+                self.readers.shutdown(wait=False)
+
+    async def execute(self, query: str, params: Union[tuple, list, None] = None):
+
+        return await self.run(self.orm.execute_query, query, params, read=self.orm.is_read_query(query))
+
+    async def iter(self, query: str, params: Union[tuple, None] = None, batch_size: int = 1000, as_dict: bool = False):
+
+        """
+        Async generator over iter_query: each fetchmany batch is pulled on an executor thread.
+        """
+        rows = self.orm.iter_query(query, params, batch_size=batch_size, as_dict=as_dict)
+
+        def next_batch():
+            return list(itertools.islice(rows, batch_size))
+
+        try:
+            while True:
+                batch = await self.run(next_batch, read=True)
+                if not batch:
+                    break
+                for row in batch:
+                    yield row
+        finally:
+            await self.run(rows.close, read=True)
+
+    async def insert(self, data: Union[tuple, list], table_name: str) -> bool:
+
+        return await self.run(self.orm.insert, data, table_name)
+
+    async def insert_many(self, table_name: str, items, **options) -> bool:
+
+        return await self.run(self.orm.insert_many, table_name, items, **options)
+
+    async def delete(self, data: Union[list, int] = None, table_name: str = "", **options) -> bool:
+
+        return await self.run(self.orm.delete, data, table_name, **options)
+
+    async def enqueue(self, query: str, params: tuple = ()) -> dict:
+
+        """
+        Group-committed write: resolves once the batch holding it is durable.
+        Without a pool the group commit thread would share the single connection with
+        the writer thread, so the write runs on the writer thread instead (same result).
+        """
+        if self.orm.pool is None:
+            def write():
+                with self.orm.transaction() as conn:
+                    cursor = conn.execute(query, tuple(params or ()))
+                    return {"rowcount": cursor.rowcount, "lastrowid": cursor.lastrowid}
+
+            return await self.run(write)
+
+        return await asyncio.wrap_future(self.orm.enqueue(query, params))
+
+    async def transaction(self, fn, *args, **kwargs):
+
+        """
+        Run fn(orm, *args) inside orm.transaction() on the writer thread
+        (transaction state is per thread, so the whole unit of work must run there).
+        """
+        def unit_of_work():
+            with self.orm.transaction():
+                return fn(self.orm, *args, **kwargs)
+
+        return await self.run(unit_of_work)
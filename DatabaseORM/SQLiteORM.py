@@ -7,9 +7,22 @@ import sys
 import time
 from helpers.utils import *
 import json
+import itertools
+from contextlib import contextmanager, nullcontext
 
 # Auxiliar classes
 from helpers.QueryResults import QueryResults
+from helpers.ConnectionPool import ConnectionPool
+from helpers.SchemaCache import SchemaCache
+from helpers.AdaptiveBatcher import AdaptiveBatcher
+from helpers.FileIO import read_rows, write_rows, column_name
+from helpers.QueryBuilder import QueryBuilder
+from helpers.QueryProfiler import QueryProfiler
+from helpers.QueryStats import QueryStats
+from helpers.GroupCommitWriter import GroupCommitWriter
+from helpers.RowMapper import RowFactory
+from helpers.Maintenance import MaintenanceService
+import helpers.PragmaProfiles as pragma_profiles
 
 class SQLiteORM:
 
@@ -22,6 +35,18 @@ class SQLiteORM:
         self.query = None
         self.deleted_rows = 0
         self.stream_mode = False
+        self.pool = None
+        self.schema = SchemaCache()
+        self.local = threading.local() # per-thread transaction state
+        self.insert_stats = None
+        self.profiles = [] # stack of (name, conn, previous pragma values)
+        self.hooks = [] # callables receiving one event dict per statement
+        self.profiler = None
+        self.stats = None
+        self.group_writer = None
+        self.row_mapper = RowFactory()
+        self.row_mapping = False # rows as generated __slots__ objects instead of sqlite3.Row
+        self.maintenance = None
 
     def get_database(self) -> str:
 
@@ -31,49 +56,130 @@ class SQLiteORM:
 
     def close_connection(self) -> None:
 
-        self.conn.close()
+        self.stop_group_commit()
+        self.stop_maintenance()
+        if self.pool is not None:
+            self.close_pool()
+        if self.conn is not None:
+            self.conn.close()
 
     def connect_DB(self) -> Union[sql.Connection, None]:
 
         try:
             self.conn = sql.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sql.Row
+            self.conn.row_factory = None if self.row_mapping else sql.Row
             self.cursor = self.conn.cursor()
-            self.cursor.execute("PRAGMA journal_mode=WAL;") # multi threading to avoid blocks of database
+            self.schema.invalidate()
+            self.cursor.execute("PRAGMA journal_mode=WAL;").fetchall() # multi threading to avoid blocks of database
             print("✅ Connection success to database:", self.db_name.split('.')[-1])
             return self.conn
         except sql.Error as e:
             print(f"❌ Database error: {e}")
             return None
 
+    def connect_pool(self, size: int = 5, timeout: float = 30.0, read_optimized: bool = False, shared_cache: bool = False) -> Union[ConnectionPool, None]:
+
+        """
+        Switch the ORM to pooled mode: every execute_query checks out its own
+        connection (reader for SELECT, serialized writer otherwise).
+        read_optimized=True sizes mmap/cache of the readers for this DB and machine
+        (PragmaProfiles.read_profile); shared_cache=True makes them share one page cache.
+        """
+        try:
+            reader_settings = None
+            if read_optimized:
+                reader_settings = pragma_profiles.read_profile(self.db_path, connections=1 if shared_cache else size)
+            self.pool = ConnectionPool(self.db_path, size=size, timeout=timeout, reader_settings=reader_settings, shared_cache=shared_cache)
+            if self.row_mapping:
+                self.pool.row_factory = None
+            with self.pool.writer():
+                pass
+            print(f"✅ Connection pool ready ({self.pool.size} readers + 1 writer):", self.db_name.split('.')[-1])
+            return self.pool
+        except sql.Error as e:
+            print(f"❌ Connection pool error: {e}")
+            self.pool = None
+            return None
+
+    def close_pool(self) -> None:
+
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+    def read_connection(self):
+
+        """
+        with db.read_connection() as conn: ...
+        """
+        if self.pool is None:
+            raise Exception("Connection pool is not active, call connect_pool() first")
+        return self.pool.reader()
+
+    def write_connection(self):
+
+        """
+        with db.write_connection() as conn: ...
+        """
+        if self.pool is None:
+            raise Exception("Connection pool is not active, call connect_pool() first")
+        return self.pool.writer()
+
+    def is_read_query(self, query: str) -> bool:
+
+        cmd = statement_kind(query)
+        if cmd == "PRAGMA":
+            if "=" in query:
+                return False
+            # PRAGMA main.table_info(users); -> table_info
+            name = query.lstrip()[len("PRAGMA"):].split("(")[0].strip().rstrip(";").split(".")[-1].strip()
+            return name.lower() in pragma_profiles.READ_ONLY
+        # EXPLAIN only describes the statement, it never runs it
+        return cmd in ("SELECT", "VALUES", "EXPLAIN")
+
     def connect_stream_DB(self) -> Union[sql.Connection, None]:
         
         try:
             self.conn = sql.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sql.Row
+            self.conn.row_factory = None if self.row_mapping else sql.Row
             self.cursor = self.conn.cursor()
+            self.schema.invalidate()
 
             print(f"Connecting to database {self.db_name} in eStream mode...")
 
-            self.cursor.execute("PRAGMA synchronous = OFF;")
-            self.cursor.execute("PRAGMA journal_mode = MEMORY;")
-            self.cursor.execute("PRAGMA temp_store = MEMORY;")
+            self.apply_profile("stream")
 
-            self.cursor.execute("PRAGMA locking_mode = EXCLUSIVE;")
+            print("⚡ eStream mode active! Ultra-fast performance enabled.")
+            self.stream_mode = True
+            return self.conn
 
-            self.cursor.execute("PRAGMA foreign_keys = OFF;")
+        except sql.Error as e:
+            print(f"❌ eStream connection error: {e}")
+            return None
 
-            self.cursor.execute("PRAGMA cache_size = -2000000;")
+    def connect_read_DB(self, memory_fraction: float = 0.25) -> Union[sql.Connection, None]:
 
-            self.cursor.execute("PRAGMA automatic_index = OFF;")
-            self.cursor.execute("PRAGMA cache_spill = OFF;")
+        """
+        Read-mostly connection: query_only, mmap_size sized to the DB file and a
+        page cache derived from the available RAM (PragmaProfiles.read_profile).
+        Pragmas are scoped to this connection, close_connection() is enough.
+        """
+        try:
+            self.conn = sql.connect(self.db_path, check_same_thread=False)
+            self.conn.row_factory = None if self.row_mapping else sql.Row
+            self.cursor = self.conn.cursor()
+            self.schema.invalidate()
+            self.cursor.execute("PRAGMA journal_mode=WAL;").fetchall()
 
-            print("⚡ eStream mode active! Ultra-fast performance enabled.")
-            self.stream_mode = True
+            settings = pragma_profiles.read_profile(self.db_path, memory_fraction=memory_fraction)
+            pragma_profiles.apply(self.conn, settings)
+
+            mmap_size = self.conn.execute("PRAGMA mmap_size;").fetchone()[0]
+            print(f"📖 Read mode active on {self.db_name}: mmap {mmap_size // (1024 * 1024)} MB, cache {-int(settings['cache_size']) // 1024} MB")
             return self.conn
 
         except sql.Error as e:
-            print(f"❌ eStream connection error: {e}")
+            print(f"❌ Read mode connection error: {e}")
             return None
 
     def close_connection_stream_DB(self):
@@ -81,12 +187,8 @@ class SQLiteORM:
         try:
             print("Closing eStream connection and restoring normal mode...")
 
-            self.cursor.execute("PRAGMA foreign_keys = ON;")
-            self.cursor.execute("PRAGMA journal_mode = WAL;")
-            self.cursor.execute("PRAGMA synchronous = NORMAL;")
-            self.cursor.execute("PRAGMA locking_mode = NORMAL;")
-            self.cursor.execute("PRAGMA automatic_index = ON;")
-            self.cursor.execute("PRAGMA cache_spill = ON;")
+            while self.profiles:
+                self.restore_profile()
 
             print(f"Database {self.db_name} closed and returned to stable normal mode.")
             self.conn.close()
@@ -97,18 +199,36 @@ class SQLiteORM:
             print(f"❌ Error restoring normal mode: {e}")
             return False
 
+    def table_info(self, table_name: str) -> Union[dict, None]:
+
+        """
+        Cached PRAGMA table_info: { "info", "columns", "pk", "types" }.
+        PRAGMA schema_version is re-checked at most once per check_interval.
+        """
+        if self.schema.needs_check():
+            version = self.execute_query("PRAGMA schema_version;")
+            if version:
+                self.schema.check_version(version.raw[0][0])
+
+        entry = self.schema.get(table_name)
+        if entry is not None:
+            return entry
+
+        info = self.execute_query(f"PRAGMA table_info({table_name});")
+        if not info or info.count == 0:
+            return None
+
+        return self.schema.set(table_name, [dict(row) for row in info.raw])
+
     def is_text_column(self, table_name, column):
 
-        info = self.execute_query(f"PRAGMA table_info({table_name})").json
+        info = self.table_info(table_name)
+        ctype = info["types"].get(column) if info else None
 
-        for col in info:
-            if col["name"] == column:
-                ctype = col["type"].upper()
-                if any(t in ctype for t in ("CHAR", "TEXT", "CLOB", "VARCHAR")):
-                    return True
-                return False
+        if ctype is None:
+            raise Exception(f"Column '{column}' not found in table '{table_name}'")
 
-        raise Exception(f"Column '{column}' not found in table '{table_name}'")
+        return any(t in ctype for t in ("CHAR", "TEXT", "CLOB", "VARCHAR"))
 
     def get_sqlite_type(self, value) -> str:
 
@@ -156,8 +276,8 @@ class SQLiteORM:
     def get_object_columns(self, table_name: str) -> Union[dict, None]:
 
         try:
-            columns = self.execute_query(f"PRAGMA table_info({table_name});").json
-            return columns
+            info = self.table_info(table_name)
+            return list(info["info"]) if info else []
         except sql.Error as e:
             print(f"⚠️ Error fetching columns for {table_name}: {e}")
             return None
@@ -165,10 +285,8 @@ class SQLiteORM:
     def check_columns(self, table_name: str) -> Union[list, None]:
 
         try:
-            self.cursor.execute(f"PRAGMA table_info({table_name});")
-            columns_info = self.cursor.fetchall()
-            columns = [col['name'] for col in columns_info]
-            return columns
+            info = self.table_info(table_name)
+            return list(info["columns"]) if info else None
         except sql.Error as e:
             print(f"⚠️ Error fetching columns for {table_name}: {e}")
             return None
@@ -192,71 +310,323 @@ class SQLiteORM:
 
     def execute_query(self, query: str, params: Union[tuple, list, None]=None) -> Union[list, bool]:
 
-        import re
-
         try:
 
+            if self.in_transaction():
+                return self.keep_rows(self.run_statement(self.local.conn, self.local.conn.cursor(), query, params))
+
+            if self.pool is not None:
+                connection = self.pool.reader if self.is_read_query(query) else self.pool.writer
+                with connection() as conn:
+                    return self.keep_rows(self.run_statement(conn, conn.cursor(), query, params))
+
+            self.local.rows = None # fetch_* read self.cursor
+            return self.run_statement(self.conn, self.cursor, query, params)
+
+        except sql.Error as e:
+            print(f"⚠️ Query error: {e}")
+            if self.hooks:
+                self.emit({"type": "error", "sql": query, "error": str(e)})
+            if self.in_transaction():
+                raise # let transaction() roll back
+            return False
+
+    def keep_rows(self, result):
+
+        # Pooled / transaction statements run on their own cursors (self.cursor is None in
+        # pool mode): their rows are kept per thread for fetch_all / fetch_one / fetch_many
+        self.local.rows = iter(result.raw if isinstance(result, QueryResults) else ())
+        return result
+
+    def run_statement(self, conn: sql.Connection, cursor: sql.Cursor, query: str, params: Union[tuple, list, None]=None) -> Union[QueryResults, bool]:
+
+        started = time.perf_counter()
+
+        try:
             # Check if all tables over query exist
             if params is None:
-                result = self.cursor.execute(query)
+                result = cursor.execute(query)
 
             elif isinstance(params, list):
-                
+
                 if all(isinstance(p, (list, tuple)) for p in params):
-                    result = self.cursor.executemany(query, params)
+                    result = cursor.executemany(query, params)
                 else:
                     raise ValueError("Params must be a list of tuples or lists for executemany().")
 
             else:
-                result = self.cursor.execute(query, params)
+                result = cursor.execute(query, params)
 
-            self.conn.commit()
+        except sql.Error:
+            # A failed write outside transaction() must not leave an implicit transaction open
+            if not self.in_transaction() and conn.in_transaction:
+                conn.rollback()
+            raise
 
-            cmd = query.lstrip().split()[0].upper()
+        cmd = statement_kind(query)
 
-            if cmd in ("SELECT", "PRAGMA", "WITH"):
+        # Reads never commit; writes inside transaction() wait for the outermost block
+        if not self.is_read_query(query) and not self.in_transaction():
+            self.commit(conn)
 
-                rows = result.fetchall()
-                return QueryResults(rows, formatter=self.format_results)
+        if cmd in ("CREATE", "ALTER", "DROP"):
+            self.schema.invalidate()
 
-            return True
+        if cmd in ("SELECT", "VALUES", "PRAGMA", "EXPLAIN"):
 
-        except sql.Error as e:
-            print(f"⚠️ Query error: {e}")
-            return False
+            rows = result.fetchall()
+            if self.row_mapping:
+                rows = self.row_mapper.map_rows(result, rows)
+            if self.hooks:
+                self.notify(conn, query, params, "read", len(rows), time.perf_counter() - started)
+            return QueryResults(rows, formatter=self.format_results)
 
+        if self.hooks:
+            self.notify(conn, query, params, "write", result.rowcount, time.perf_counter() - started)
+        return True
+
+    # ===============================
+    # INSTRUMENTATION HOOKS
+    # ===============================
+    def add_hook(self, hook) -> None:
+
+        """
+        hook(event) is called after every statement run through execute_query:
+        { "type": "statement", "sql", "params", "many", "kind": "read" | "write", "rows", "seconds", "conn" }
+        { "type": "commit", "seconds" }
+        { "type": "error", "sql", "error" }
+        """
+        if hook not in self.hooks:
+            self.hooks.append(hook)
+
+    def remove_hook(self, hook) -> None:
+
+        if hook in self.hooks:
+            self.hooks.remove(hook)
+
+    def commit(self, conn: sql.Connection) -> None:
+
+        if not self.hooks:
+            conn.commit()
+            return
+
+        started = time.perf_counter()
+        conn.commit()
+        self.emit({"type": "commit", "seconds": time.perf_counter() - started})
+
+    def notify(self, conn: sql.Connection, query: str, params, kind: str, rows: int, seconds: float) -> None:
+
+        self.emit({
+            "type": "statement",
+            "sql": query,
+            "params": params,
+            "many": isinstance(params, list),
+            "kind": kind,
+            "rows": rows,
+            "seconds": seconds,
+            "conn": conn,
+        })
+
+    def emit(self, event: dict) -> None:
+
+        for hook in list(self.hooks):
+            try:
+                hook(event)
+            except Exception as e:
+                print(f"⚠️ Hook error: {e}")
+
+    def enable_profiler(self, explain: bool = True) -> QueryProfiler:
+
+        """
+        Record latency/rows per statement shape and EXPLAIN QUERY PLAN every new SELECT:
+        db.enable_profiler(); ...; db.profiler.report(only_full_scans=True)
+        """
+        if self.profiler is None:
+            self.profiler = QueryProfiler(self, explain=explain)
+            self.add_hook(self.profiler)
+        return self.profiler
+
+    def disable_profiler(self) -> None:
+
+        if self.profiler is not None:
+            self.remove_hook(self.profiler)
+            self.profiler = None
+
+    def enable_stats(self, slow_query_ms: float = 200.0, sample_size: int = 1024) -> QueryStats:
+
+        """
+        Per-shape counters and p50/p95/p99 latency, commit latency and a slow-query
+        log (logging.getLogger("SQLiteORM")). Read them with stats_snapshot().
+        """
+        if self.stats is None:
+            self.stats = QueryStats(slow_query_ms=slow_query_ms, sample_size=sample_size)
+            self.add_hook(self.stats)
+        else:
+            self.stats.slow_query_ms = slow_query_ms
+        return self.stats
+
+    def disable_stats(self) -> None:
+
+        if self.stats is not None:
+            self.remove_hook(self.stats)
+            self.stats = None
+
+    def stats_snapshot(self, top: int = None) -> dict:
+
+        return self.stats.snapshot(top) if self.stats else {}
+
+    def index_suggestions(self) -> list:
+
+        return self.profiler.suggestions() if self.profiler else []
+
+    def apply_index_suggestions(self) -> list:
+
+        """
+        Create every index proposed by the profiler, then ANALYZE so the planner uses them.
+        """
+        created = []
+        for statement in self.index_suggestions():
+            if self.execute_query(statement) is not False:
+                print(f"✅ {statement}")
+                created.append(statement)
+        if created:
+            self.execute_query("ANALYZE;")
+            self.profiler.reset()
+        return created
+
+
+    # ===============================
+    # TRANSACTIONS
+    # ===============================
+    def in_transaction(self) -> bool:
+
+        return getattr(self.local, "depth", 0) > 0
+
+    @contextmanager
+    def transaction(self):
+
+        """
+        Unit of work: statements inside the block share a single commit.
+        Nested blocks become SAVEPOINTs, so an inner failure only undoes its own work.
+
+        with db.transaction():
+            db.execute_query(...)
+            with db.transaction():
+                db.execute_query(...)
+        """
+        depth = getattr(self.local, "depth", 0)
+
+        if depth > 0:
+            conn = self.local.conn
+            writer = nullcontext(conn)
+        elif self.pool is not None:
+            writer = self.pool.writer()
+        else:
+            writer = nullcontext(self.conn)
+
+        with writer as conn:
+
+            savepoint = f"orm_sp_{depth}"
+
+            if depth == 0:
+                if conn.in_transaction:
+                    # Someone else's uncommitted work: committing it here (or with our COMMIT)
+                    # would make it durable behind its owner's back
+                    raise sql.OperationalError("The connection already has an open transaction, it is not this unit of work's to commit")
+                conn.execute("BEGIN")
+            else:
+                conn.execute(f"SAVEPOINT {savepoint}")
+
+            self.local.depth = depth + 1
+            self.local.conn = conn
+
+            try:
+                yield conn
+            except BaseException:
+                if depth == 0:
+                    conn.rollback()
+                else:
+                    conn.execute(f"ROLLBACK TO {savepoint}")
+                    conn.execute(f"RELEASE {savepoint}")
+                raise
+            else:
+                if depth == 0:
+                    try:
+                        self.commit(conn)
+                    except BaseException:
+                        # e.g. a deferred foreign key: leave nothing open for the next BEGIN
+                        if conn.in_transaction:
+                            conn.rollback()
+                        raise
+                else:
+                    conn.execute(f"RELEASE {savepoint}")
+            finally:
+                self.local.depth = depth
+                if depth == 0:
+                    self.local.conn = None
+
+    # ===============================
+    # GROUP COMMIT ( many tiny writes, one fsync )
+    # ===============================
+    def start_group_commit(self, max_rows: int = 500, max_delay_ms: float = 5.0) -> GroupCommitWriter:
+
+        if self.group_writer is None:
+            self.group_writer = GroupCommitWriter(self, max_rows=max_rows, max_delay_ms=max_delay_ms)
+        return self.group_writer
+
+    def stop_group_commit(self) -> None:
+
+        if self.group_writer is not None:
+            self.group_writer.stop()
+            self.group_writer = None
+
+    def enqueue(self, query: str, params: tuple = ()):
+
+        """
+        Queue a write for the group commit writer, returns a Future:
+        db.enqueue("UPDATE game_scores SET score = ? WHERE id = ?", (10, 3)).result()
+        """
+        return self.start_group_commit().submit(query, params)
 
     # ===============================
     # INSERT ORM ( insert both single values and many values)
     # ===============================
-    def insert_many(self, table_name: str, items: list):
+    def insert_many(self, table_name: str, items, multi_values: bool = False, target_seconds: float = 0.25):
         """
         Insert multiple rows:
         items = [
             (v1, v2, v3, ...),
             (v1, v2, v3, ...),
         ]
+        items may be any iterable (csv.reader, generator, pandas chunk iterator...):
+        it is consumed chunk by chunk, so memory stays O(chunk).
+        Chunk size adapts so each chunk takes about `target_seconds`;
+        multi_values=True packs rows into INSERT ... VALUES (...), (...) statements.
+        Throughput of the last call is kept in self.insert_stats.
         """
 
         try:
-            if not items:
+            rows = iter_rows(items)
+            sample = list(itertools.islice(rows, 100))
+            if not sample:
                 raise Exception("items is empty, there are not rows to insert.")
 
+            total = len(items) if hasattr(items, "__len__") and not hasattr(items, "itertuples") else None
+            rows = itertools.chain(sample, rows)
+
             # ==========================
             # 1. COLUMNAS DE LA TABLA
             # ==========================
-            columns = self.check_columns(table_name)
-            if not columns:
+            info = self.table_info(table_name)
+            if not info:
                 raise Exception(f"It could not be obtained columns from {table_name}")
 
+            columns = info["columns"]
+
             # ==========================
             # 2. PRIMARY KEY
             # ==========================
-            info = self.get_object_columns(table_name)
-            if not info:
-                raise Exception(f"It could not be obtained table_info PRAGMA from '{table_name}'")
-
-            primary_keys = [col["name"] for col in info if col["pk"] == 1]
+            primary_keys = info["pk"]
 
             cols_to_insert = [c for c in columns if c not in primary_keys]
 
@@ -266,52 +636,56 @@ class SQLiteORM:
                 )
 
             # ==========================
-            # 3. VALIDACIÓN DE FILAS
+            # 3. VALIDACIÓN DE FILAS (por bloque, ver validate_chunk)
             # ==========================
             expected_cols = len(cols_to_insert)
-
-            for row in items:
-                if len(row) != expected_cols:
-                    raise Exception(
-                        f"Row {row} has {len(row)} values but awaited for {expected_cols}: {cols_to_insert}"
-                    )
+            self.validate_chunk(sample, expected_cols, cols_to_insert)
 
             # ==========================
             # 4. QUERY PREPARADA
             # ==========================
-            placeholders = ", ".join(["?"] * expected_cols)
-            base_query = (
-                f"INSERT INTO {table_name} ({', '.join(cols_to_insert)}) "
-                f"VALUES ({placeholders})"
+            base_query = self.schema.statement(
+                ("insert", table_name),
+                lambda: (
+                    f"INSERT INTO {table_name} ({', '.join(cols_to_insert)}) "
+                    f"VALUES ({', '.join(['?'] * expected_cols)})"
+                )
             )
 
-            # ==========================
-            # 5. PRAGMA TURBO
-            # ==========================
-            self.activate_stream()
-
             # ==========================
             # 6. CHUNK SIZE INTELIGENTE
             # ==========================
-            chunk_size = auto_chunk_size(items, mode="sqlite")
-            total = len(items)
+            chunk_size = auto_chunk_size(sample, mode="sqlite")
+            batcher = AdaptiveBatcher(initial=chunk_size, target_seconds=target_seconds)
 
-            print(f"INSERT MANY INIT ({total} rows)…")
+            print(f"INSERT MANY INIT ({total if total is not None else 'streamed'} rows)…")
             print(f"✔ Recorded columns: {cols_to_insert}")
-            print(f"✔ Chunk size: {chunk_size:,}")
+            print(f"✔ Initial chunk size: {chunk_size:,}")
 
             # ==========================
             # 7. INSERT POR BLOQUES
             # ==========================
-            for start in range(0, total, chunk_size):
-                chunk = items[start : start + chunk_size]
-                self.execute_query(base_query, chunk)
-                print(f"   → Recorded {start + len(chunk)}/{total}")
-
             # ==========================
-            # 8. RESTAURAR PRAGMAS
+            # 5. PRAGMA TURBO (bulk profile, restored even on error)
             # ==========================
-            self.desactivate_stream()
+            with self.profile("bulk"), self.transaction(): # one commit for the whole load
+                start = 0
+                while True:
+                    chunk = list(itertools.islice(rows, batcher.size))
+                    if not chunk:
+                        break
+                    self.validate_chunk(chunk, expected_cols, cols_to_insert)
+                    began = time.perf_counter()
+                    if multi_values:
+                        self.insert_chunk_values(table_name, cols_to_insert, chunk)
+                    else:
+                        self.execute_query(base_query, chunk)
+                    batcher.record(len(chunk), time.perf_counter() - began)
+                    start += len(chunk)
+                    print(f"   → Recorded {start}/{total if total is not None else '?'} (chunk {len(chunk):,}, {batcher.rows_per_second:,.0f} rows/s)")
+
+            self.insert_stats = batcher.stats()
+            print(f"✔ {self.insert_stats['rows']:,} rows at {self.insert_stats['rows_per_second']:,.0f} rows/s (final chunk size {batcher.size:,})")
 
             print("✅ INSERT MANY DONE")
             return True
@@ -321,28 +695,69 @@ class SQLiteORM:
             return False
 
 
+    def validate_chunk(self, chunk: list, expected_cols: int, columns: list) -> None:
+
+        for row in chunk:
+            if len(row) != expected_cols:
+                raise Exception(
+                    f"Row {row} has {len(row)} values but awaited for {expected_cols}: {columns}"
+                )
+
+    def insert_chunk_values(self, table_name: str, columns: list, chunk: list) -> None:
+
+        """
+        Multi-row VALUES insert, never exceeding SQLITE_MAX_VARIABLES placeholders per statement.
+        """
+        width = len(columns)
+        per_statement = max(1, SQLITE_MAX_VARIABLES // width)
+
+        def build(rows):
+            return self.schema.statement(
+                ("insert_values", table_name, rows),
+                lambda: (
+                    f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
+                    + ", ".join([f"({', '.join(['?'] * width)})"] * rows)
+                )
+            )
+
+        full = len(chunk) // per_statement * per_statement
+        if full:
+            self.execute_query(
+                build(per_statement),
+                [tuple(v for row in chunk[i : i + per_statement] for v in row) for i in range(0, full, per_statement)]
+            )
+        # Remainder in power-of-two statements (37 rows -> 32 + 4 + 1): the statement cache
+        # holds at most log2(per_statement) shapes per table instead of one per remainder length
+        rest = chunk[full:]
+        while rest:
+            size = 1 << (len(rest).bit_length() - 1)
+            self.execute_query(build(size), tuple(v for row in rest[:size] for v in row))
+            rest = rest[size:]
+
     def insert(self, data: Union[tuple, list], table_name: str )-> bool:
 
         try:
             if isinstance(data, (list, tuple)) and not any(isinstance(row, (list, tuple)) for row in data):
-                columns_name_db =  self.check_columns( table_name )
-                columns_type_db = [
-                    self.execute_query(f"SELECT typeof({col}) as type from {table_name} limit 1")[0]['type']
-                    for col in columns_name_db
-                ]
+                info = self.table_info( table_name )
+                if not info:
+                    raise ValueError(f"Table '{table_name}' does not exist.")
+
+                columns_name_db = info["columns"]
                 if len(data) != len(columns_name_db):
                     raise ValueError("Data length does not match number of columns in the table.")
 
                 # Detect primary keys because they might be autoincrement amd it is not necessary to provide a value
-                info = self.execute_query(f"PRAGMA table_info({table_name})")
-                primary_keys = [col['name'] for col in info if col['pk'] == 1]
-                placeholders = ", ".join(["?"] * ( len(data) - len(primary_keys) ))
-                
-                # Build insert or ignore into query
-                query = f"INSERT OR IGNORE INTO {table_name} ({', '.join([col for col in columns_name_db if col not in primary_keys])}) VALUES ({placeholders})"
-                print(f"Query: {query}")
+                primary_keys = info["pk"]
+
+                # Build insert or ignore into query (built once per table)
+                query = self.schema.statement(
+                    ("insert_or_ignore", table_name),
+                    lambda: (
+                        f"INSERT OR IGNORE INTO {table_name} ({', '.join([col for col in columns_name_db if col not in primary_keys])}) "
+                        f"VALUES ({', '.join(['?'] * ( len(columns_name_db) - len(primary_keys) ))})"
+                    )
+                )
 
-                print(f"Placeholders: {placeholders}")
                 args = tuple(
                     val for i, val in enumerate(data) 
                     if columns_name_db[i] not in primary_keys
@@ -361,66 +776,166 @@ class SQLiteORM:
     # ===============================
     # SELECT ORM ( select both by clasical and criterial)
     # ===============================
+    def table(self, table: str) -> QueryBuilder:
+
+        """
+        Fluent builder, compiled SQL is cached per query shape:
+        db.table("productos").select("id", "name").where("price", ">", 10).order_by("price").limit(50).all()
+        """
+        return QueryBuilder(self, table)
+
     def select_all(self, table: str):
 
-        query = f"SELECT * FROM {table}"
-        return self.execute_query(query)
+        return self.table(table).all()
 
     def select_one(self, table: str, **conditions):
 
         if not conditions:
             raise ValueError("select_one requires at least one condition.")
 
-        conditions_list = [f"{col} = ?" for col in conditions]
-        where = " AND ".join(conditions_list)
-        params = tuple(conditions.values())
-
-        query = f"SELECT * FROM {table} WHERE {where} LIMIT 1"
-        result = self.execute_query(query, params)
-        return result[0] if result else None
+        return self.filter_equal(table, conditions).first()
 
     def select_where(self, table: str, **conditions):
 
-        conditions_list = [f"{col} = ?" for col in conditions]
-        where = " AND ".join(conditions_list)
-        params = tuple(conditions.values())
+        return self.filter_equal(table, conditions).all()
 
-        query = f"SELECT * FROM {table} WHERE {where}"
-        return self.execute_query(query, params)
+    def filter_equal(self, table: str, conditions: dict) -> QueryBuilder:
+
+        # Column names come from the caller: add them as plain "=" conditions, never
+        # through where()'s arguments (a column called "value", a value called "in")
+        builder = self.table(table)
+        for column, value in conditions.items():
+            builder.add_condition(column, "=", value)
+        return builder
 
     def select_columns(self, table: str, columns: list):
 
-        cols = ", ".join(columns)
-        query = f"SELECT {cols} FROM {table}"
-        return self.execute_query(query)
+        return self.table(table).select(*columns).all()
 
     def select_by_id(self, table: str, id_column: str, id_value):
 
-        query = f"SELECT * FROM {table} WHERE {id_column} = ? LIMIT 1"
-        result = self.execute_query(query, (id_value,))
-        return result[0] if result else None
+        return self.table(table).add_condition(id_column, "=", id_value).first()
 
     def select_like(self, table: str, column: str, pattern: str):
 
-        query = f"SELECT * FROM {table} WHERE {column} LIKE ?"
-        return self.execute_query(query, (pattern,))
+        return self.table(table).where(column, "LIKE", pattern).all()
 
     def select_in(self, table: str, column: str, values: list):
-        
-        placeholders = ", ".join("?" for _ in values)
-        query = f"SELECT * FROM {table} WHERE {column} IN ({placeholders})"
-        return self.execute_query(query, values)
+
+        # Lists over the SQLite variable limit are split in chunks automatically
+        return self.table(table).where_in(column, values).all()
+
+    # ===============================
+    # STREAMING SELECT ( constant memory for big tables )
+    # ===============================
+    def iter_query(self, query: str, params: Union[tuple, None] = None, batch_size: int = 1000, as_dict: bool = False):
+
+        """
+        Generator over a SELECT, pulling `batch_size` rows at a time with fetchmany:
+        for row in db.iter_query("SELECT * FROM productos", batch_size=5000): ...
+        In pooled mode the reader connection is held until the generator is exhausted or closed.
+        """
+        if self.in_transaction():
+            connection = nullcontext(self.local.conn)
+        elif self.pool is not None:
+            connection = self.pool.reader()
+        else:
+            connection = nullcontext(self.conn)
+
+        with connection as conn:
+            cursor = conn.cursor() # own cursor, self.cursor stays untouched
+            try:
+                cursor.execute(query, params or ())
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    if self.row_mapping:
+                        rows = self.row_mapper.map_rows(cursor, rows)
+                    for row in rows:
+                        yield dict(row) if as_dict else row
+            finally:
+                cursor.close()
+
+    def keyset_column(self, table: str, key: Union[str, None] = None) -> str:
+
+        if key:
+            return key
+
+        info = self.table_info(table)
+        primary_keys = info["pk"] if info else []
+        return primary_keys[0] if len(primary_keys) == 1 else "rowid"
+
+    def select_page(self, table: str, after=None, limit: int = 100, key: Union[str, None] = None, columns: Union[str, list] = "*", where: Union[str, None] = None, params: tuple = (), descending: bool = False) -> tuple:
+
+        """
+        Keyset pagination: O(limit) per page no matter how deep, unlike OFFSET.
+        Returns (QueryResults, next_cursor); next_cursor is None on the last page.
+
+        rows, cursor = db.select_page("productos", limit=500)
+        rows, cursor = db.select_page("productos", after=cursor, limit=500)
+        """
+        key = self.keyset_column(table, key)
+        select_list = [c.strip() for c in columns.split(",")] if isinstance(columns, str) else list(columns)
+        select_cols = ", ".join(select_list)
+        # The next cursor is read from the key column: it must always be selected
+        if key == "rowid":
+            select_cols = f"rowid AS rowid, {select_cols}"
+        elif "*" not in select_list and key.lower() not in (c.split()[-1].split(".")[-1].lower() for c in select_list):
+            select_cols = f"{key}, {select_cols}"
+
+        conditions = [f"({where})"] if where else []
+        args = list(params)
+        if after is not None:
+            conditions.append(f"{key} {'<' if descending else '>'} ?")
+            args.append(after)
+
+        query = f"SELECT {select_cols} FROM {table}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {key} {'DESC' if descending else 'ASC'} LIMIT ?"
+        args.append(limit)
+
+        result = self.execute_query(query, tuple(args))
+        if result is False:
+            return result, None
+
+        next_cursor = result.raw[-1][key] if result.count == limit else None
+        return result, next_cursor
+
+    def iter_keyset(self, table: str, key: Union[str, None] = None, columns: Union[str, list] = "*", where: Union[str, None] = None, params: tuple = (), batch_size: int = 1000, as_dict: bool = False):
+
+        """
+        Generator over a whole table page by page with select_page.
+        No cursor stays open between batches, so long scans never pin a read snapshot.
+        """
+        after = None
+        while True:
+            result, after = self.select_page(table, after=after, limit=batch_size, key=key, columns=columns, where=where, params=params)
+            if not result:
+                break
+            for row in result.raw:
+                yield dict(row) if as_dict else row
+            if after is None:
+                break
 
     # ========================
     # DELETE RECORDS
     # ========================
-    def delete(self, data: Union[list, int] = None, table_name: str = "") -> bool:
+    def delete(self, data: Union[list, int] = None, table_name: str = "", batch_size: int = 10000, progress=None) -> bool:
 
+        """
+        Delete by id, list of ids, [column, op, value], [column, "LIKE", pattern]
+        or [column, "BETWEEN", (v1, v2)]. Rows are removed in batches of `batch_size`,
+        each batch in its own short transaction; progress(deleted, total) is called per batch.
+        """
         try:
-
-            row_count = 0
-
             self.activate_stream()
+        except sql.Error as e:
+            print(f"⚠️ Could not apply bulk profile: {e}")
+            return False
+
+        try:
 
             # Validate table
             if not self.check_table(table_name):
@@ -442,8 +957,7 @@ class SQLiteORM:
             # CASE: data as only ID
             # =============================
             if isinstance(data, int):
-                placeholders = "?"
-                where = f" WHERE {name_primary_key} IN ({placeholders})"
+                where = f"{name_primary_key} = ?"
                 params = (data,)
 
             # =============================
@@ -457,11 +971,9 @@ class SQLiteORM:
                 and isinstance(data[2], (int, float, str))
             ):
                 column, op, value = data
-                where = f" WHERE {column} {op} ?"
+                where = f"{column} {op} ?"
                 params = (value,)
 
-                row_count = self.processing_stream(table=table_name, column=column, operator=op, value=value)
-
             # --- LIKE ---
             elif (
                 isinstance(data, list)
@@ -482,7 +994,7 @@ class SQLiteORM:
                 if not self.is_text_column(table_name, column):
                     raise Exception(f"Cannot use {op} on non-text column '{column}' (type: {type_value})")
                     
-                where = f" WHERE {column} {op} ?"
+                where = f"{column} {op} ?"
                 params = (value,)
 
             # --- BETWEEN ---
@@ -495,7 +1007,7 @@ class SQLiteORM:
                 and len(data[2]) == 2
             ):
                 column, op, (v1, v2) = data[0], data[1], data[2]
-                where = f" WHERE {column} {op.upper()} ? AND ?"
+                where = f"{column} {op.upper()} ? AND ?"
                 params = (v1, v2)
 
             elif isinstance(data, list) and len(data) > 0:
@@ -504,7 +1016,6 @@ class SQLiteORM:
 
                 # Stream delete
                 for item in data:
-                    print(f"Processing id ({item})")
                     if self.get_sqlite_type(item) != type_primary_key:
                         print(f"Error processing id {item}")
                         wrong_ids.append(item)
@@ -514,67 +1025,360 @@ class SQLiteORM:
                         f"IDs {', '.join(map(str, wrong_ids))} do not match primary key type '{type_primary_key}' in table '{table_name}'"
                     )
 
-                # Crear placeholders seguros
-                placeholders = ", ".join(["?"] * len(data))
-                where = f" WHERE {name_primary_key} IN ({placeholders})"
-                params = tuple(data)
+                row_count = self.delete_ids(table_name, name_primary_key, data, batch_size, progress)
+                return self.finish_delete(row_count)
 
             else:
                 raise Exception("You must provide an integer ID or a list of IDs for deletion.")
 
-            if row_count == 0:
-                print("No rows found to delete with the provided criteria.")
-                return False
+            row_count = self.delete_stream(table_name, where, params, batch_size, progress)
+            return self.finish_delete(row_count)
+
+        except Exception as e:
+            print(f"Error: {e}")
+            return False
 
-            query = f"DELETE FROM {table_name}{where}"
+        finally:
+            self.desactivate_stream()
 
-            self.execute_query(query, params)
+    def finish_delete(self, row_count: int) -> bool:
 
-            print("✅ Delete successful")
+        self.deleted_rows = row_count
 
-            self.desactivate_stream()
+        if row_count == 0:
+            print("No rows found to delete with the provided criteria.")
+            return False
 
-            print(f"Rows deleted: {row_count if isinstance(data, list) else 1}")
+        print("✅ Delete successful")
+        print(f"Rows deleted: {row_count}")
 
-            if row_count > 50000:
-                print("🛠️  Performing VACUUM to optimize database after large delete...")
-                self.execute_query("VACUUM;")
-                print("✅ VACUUM completed.")
+        if row_count > 50000:
+            self.incremental_vacuum()
 
-            return True
+        return True
+
+    def report_delete(self, deleted: int, total: int) -> None:
+
+        print(f"   → Deleted {deleted}/{total} ({(deleted / total) * 100:.1f}%)")
+
+    def delete_stream(self, table_name: str, where: str, params: tuple, batch_size: int = 10000, progress=None) -> int:
+
+        """
+        Walk the matching rows in rowid ranges of at most `batch_size` rows:
+        each step finds the upper rowid of the next batch, then deletes
+        (lo, hi] in its own transaction so readers and writers get the DB back between batches.
+        """
+        progress = progress or self.report_delete
+
+        total = self.execute_query(f"SELECT count(*) FROM {table_name} WHERE {where}", params)
+        total = total.scalar if total else 0
+        if not total:
+            return 0
+
+        print(f"   → Found {total} rows to delete.")
+
+        bound_query = self.schema.statement(
+            ("delete_bound", table_name, where),
+            lambda: f"SELECT max(rowid) FROM (SELECT rowid FROM {table_name} WHERE rowid > ? AND ({where}) ORDER BY rowid LIMIT ?)"
+        )
+        delete_query = self.schema.statement(
+            ("delete_range", table_name, where),
+            lambda: f"DELETE FROM {table_name} WHERE rowid > ? AND rowid <= ? AND ({where})"
+        )
+
+        deleted = 0
+        low = -sys.maxsize - 1
+
+        while True:
+            with self.transaction() as conn:
+                high = conn.execute(bound_query, (low, *params, batch_size)).fetchone()[0]
+                if high is None:
+                    break
+                deleted += conn.execute(delete_query, (low, high, *params)).rowcount
+            low = high
+            progress(deleted, max(total, deleted))
+
+        return deleted
+
+    def delete_ids(self, table_name: str, column: str, ids: list, batch_size: int = 10000, progress=None) -> int:
+
+        progress = progress or self.report_delete
+        batch_size = max(1, min(batch_size, SQLITE_MAX_VARIABLES))
+        total = len(ids)
+        deleted = 0
+
+        for start in range(0, total, batch_size):
+            chunk = ids[start : start + batch_size]
+            query = self.schema.statement(
+                ("delete_ids", table_name, column, len(chunk)),
+                lambda: f"DELETE FROM {table_name} WHERE {column} IN ({', '.join(['?'] * len(chunk))})"
+            )
+            with self.transaction() as conn:
+                deleted += conn.execute(query, tuple(chunk)).rowcount
+            # Rows actually deleted; `total` is the number of ids, some may not exist
+            progress(deleted, total)
+
+        return deleted
+
+    def incremental_vacuum(self, pages_per_step: int = 1000) -> int:
+
+        """
+        Give free pages back to the OS in small steps instead of a blocking VACUUM.
+        Needs auto_vacuum = INCREMENTAL (see enable_incremental_vacuum).
+        """
+        mode = self.execute_query("PRAGMA auto_vacuum;")
+        if not mode or mode.scalar != 2:
+            print("ℹ️  auto_vacuum is not INCREMENTAL, skipping vacuum (run enable_incremental_vacuum() once).")
+            return 0
+
+        released = 0
+        while True:
+            free = self.execute_query("PRAGMA freelist_count;")
+            free = free.scalar if free else 0
+            if not free:
+                break
+            step = min(free, pages_per_step)
+            with self.transaction() as conn:
+                conn.execute(f"PRAGMA incremental_vacuum({step});").fetchall()
+            released += step
+
+        print(f"✅ Incremental vacuum released {released} pages.")
+        return released
+
+    def enable_incremental_vacuum(self) -> bool:
+
+        """
+        One-off switch to auto_vacuum = INCREMENTAL (requires a full VACUUM to take effect).
+        """
+        if self.execute_query("PRAGMA auto_vacuum = INCREMENTAL;") is False:
+            return False
+        return self.execute_query("VACUUM;")
+
+    # ========================
+    # MAINTENANCE ( backups, checkpoints, vacuum, optimize )
+    # ========================
+    def start_maintenance(self, tick: float = 1.0, **options) -> MaintenanceService:
+
+        """
+        Scheduled upkeep on a background thread with its own connection:
+        db.start_maintenance(checkpoint_interval=60, vacuum_interval=300, optimize_interval=3600)
+        """
+        if self.maintenance is None:
+            self.maintenance = MaintenanceService(self.db_path, **options)
+        self.maintenance.start(tick)
+        return self.maintenance
+
+    def stop_maintenance(self) -> None:
+
+        if self.maintenance is not None:
+            self.maintenance.stop()
+            self.maintenance = None
+
+    def backup(self, target_path: str, pages: int = 1024, sleep: float = 0.005, progress=None) -> Union[dict, bool]:
+
+        """
+        Online backup in batches of `pages` pages, readers and writers are not blocked.
+        """
+        try:
+            service = self.maintenance or MaintenanceService(self.db_path)
+            result = service.backup(target_path, pages=pages, sleep=sleep, progress=progress)
+            print(f"✅ Backup of {self.db_name} written to {target_path} ({result['pages']} pages, {result['seconds']}s)")
+            return result
+        except (sql.Error, OSError) as e:
+            print(f"❌ Backup error: {e}")
+            return False
+
+
+    # ========================
+    # IMPORT / EXPORT FILES
+    # ========================
+    def infer_column_types(self, header: list, sample: list) -> list:
+
+        types = []
+        for i, _ in enumerate(header):
+            found = {self.get_sqlite_type(row[i]) for row in sample if i < len(row) and row[i] is not None}
+            if not found:
+                types.append("TEXT")
+            elif found == {"INTEGER"}:
+                types.append("INTEGER")
+            elif found <= {"INTEGER", "REAL"}:
+                types.append("REAL")
+            elif found == {"BLOB"}:
+                types.append("BLOB")
+            else:
+                types.append("TEXT")
+        return types
+
+    def import_file(self, path: str, table_name: str, format: str = None, indexes: list = None, if_exists: str = "append", sample_size: int = 1000, **reader_options) -> Union[int, bool]:
+
+        """
+        Stream a CSV / JSON-lines / Parquet file into `table_name`:
+        - column types inferred from the first `sample_size` rows
+        - table created if needed, indexes built after the load
+        - loaded with insert_many under the "bulk" pragma profile
+        db.import_file("all_stocks_5yr.csv", "stocks", indexes=["Name", ("Name", "date")])
+        """
+        try:
+            header, rows = read_rows(path, format, **reader_options)
+            if not header:
+                raise Exception(f"'{path}' has no header / rows")
+
+            columns = [column_name(col) for col in header]
+            sample = list(itertools.islice(rows, sample_size))
+            types = self.infer_column_types(columns, sample)
+
+            exists = self.check_table(table_name)
+            if exists and if_exists == "fail":
+                raise Exception(f"Table '{table_name}' already exists")
+            if exists and if_exists == "replace":
+                self.execute_query(f"DROP TABLE {table_name};")
+                exists = False
+
+            if not exists:
+                definition = ", ".join(f"{col} {ctype}" for col, ctype in zip(columns, types))
+                if self.execute_query(f"CREATE TABLE {table_name} ({definition});") is False:
+                    raise Exception(f"It could not be created table '{table_name}'")
+
+            print(f"IMPORT {path} → {table_name} ({', '.join(f'{c} {t}' for c, t in zip(columns, types))})")
+
+            with self.profile("bulk"):
+                if not self.insert_many(table_name, itertools.chain(sample, rows)):
+                    raise Exception(f"Load of '{path}' failed")
+
+            for index in indexes or []:
+                cols = [column_name(c) for c in ([index] if isinstance(index, str) else index)]
+                self.execute_query(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{'_'.join(cols)} ON {table_name} ({', '.join(cols)});")
+
+            self.execute_query(f"ANALYZE {table_name};")
+
+            imported = self.insert_stats["rows"]
+            print(f"✅ Imported {imported:,} rows into '{table_name}'")
+            return imported
 
         except Exception as e:
-            print(f"Error: {e}")
+            print(f"❌ import_file error: {e}")
             return False
 
+    def export_table(self, table_name: str, path: str, format: str = None, query: str = None, params: tuple = None, batch_size: int = 10000, **writer_options) -> Union[int, bool]:
+
+        """
+        Stream a table (or any SELECT given in `query`) into CSV / JSON-lines / Parquet
+        with iter_query, so memory stays flat whatever the table size.
+        """
+        try:
+            rows = self.iter_query(query or f"SELECT * FROM {table_name}", params, batch_size=batch_size)
+            first = next(rows, None)
+
+            if first is not None:
+                header = list(first.keys())
+                rows = itertools.chain([first], rows)
+            else:
+                header = self.check_columns(table_name) or []
+
+            written = write_rows(path, header, rows, format, batch_size=batch_size, **writer_options)
+            print(f"✅ Exported {written:,} rows from '{table_name}' to {path}")
+            return written
+
+        except Exception as e:
+            print(f"❌ export_table error: {e}")
+            return False
 
     # ========================
     # FETCHING DATA
     # ========================  
     def fetch_all(self) -> list[dict]:
 
+        pending = getattr(self.local, "rows", None)
+        if pending is not None:
+            rows = list(pending)
+            return rows if self.row_mapping else [dict(row) for row in rows]
+
         rows = self.cursor.fetchall()
 
+        if self.row_mapping:
+            return self.row_mapper.map_rows(self.cursor, rows)
+
         results = [dict(row) for row in rows]
 
         return results
 
     def fetch_one(self) -> Union[dict, None]:
 
+        pending = getattr(self.local, "rows", None)
+        if pending is not None:
+            row = next(pending, None)
+            if row is None:
+                return None
+            return row._asdict() if self.row_mapping else dict(row)
+
         row = self.cursor.fetchone()
 
+        if row and self.row_mapping:
+            return self.row_mapper.map_rows(self.cursor, [row])[0]._asdict()
         if row:
             return dict(row)
         return None
     
     def fetch_many(self, size: int) -> list[dict]:
 
+        pending = getattr(self.local, "rows", None)
+        if pending is not None:
+            rows = list(itertools.islice(pending, size))
+            return rows if self.row_mapping else [dict(row) for row in rows]
+
         rows = self.cursor.fetchmany(size)
 
+        if self.row_mapping:
+            return self.row_mapper.map_rows(self.cursor, rows)
+
         results = [dict(row) for row in rows]
 
         return results
 
+    # =====================
+    # ROW MAPPING
+    # =====================
+    def row_class(self, table_name: str) -> type:
+
+        """
+        __slots__ class for the rows of `table_name`, built from the cached table_info:
+        Productos = db.row_class("productos"); p = db.select_by_id("productos", "id", 1); p.price
+        """
+        info = self.table_info(table_name)
+        if not info:
+            raise ValueError(f"Table '{table_name}' does not exist.")
+        return self.row_mapper.register(table_name, info["columns"])
+
+    def enable_row_mapping(self, *tables) -> RowFactory:
+
+        """
+        Return rows as generated tuple classes (row.name, row["name"], row[0], dict(row))
+        instead of sqlite3.Row, and skip the dict-per-row copies in fetch_all/fetch_many.
+        SELECT * on one of `tables` gets that table's class, other layouts an anonymous Row class.
+        Connections then fetch plain tuples and the ORM maps them in bulk, so raw
+        conn.execute() through read_connection()/transaction() returns plain tuples meanwhile.
+        """
+        for table in tables:
+            self.row_class(table)
+        self.row_mapping = True
+        self.set_row_factory(None)
+        return self.row_mapper
+
+    def disable_row_mapping(self) -> None:
+
+        self.row_mapping = False
+        self.set_row_factory(sql.Row)
+
+    def set_row_factory(self, factory) -> None:
+
+        # Cursors copy the factory when they are created, self.cursor needs it too
+        if self.conn is not None:
+            self.conn.row_factory = factory
+        if self.cursor is not None:
+            self.cursor.row_factory = factory
+        if self.pool is not None:
+            self.pool.row_factory = factory
+
     # =====================
     # FORMATING DATA
     # =====================
@@ -625,21 +1429,6 @@ class SQLiteORM:
 
         return table
 
-    def processing_stream(self, **statements) -> int:
-
-        table_name, column, operator, value = list(statements.values())
-        ids = self.execute_query(f"SELECT {column} FROM {table_name} WHERE {column} {operator} ?", (value,)).json
-        print(f"   → Found {len(ids)} rows to process.")
-        total_ids = len(ids)
-        percentage_step = max(total_ids // 10, 1)
-        for idx in range(total_ids):
-            if (idx + 1) % percentage_step == 0 or (idx + 1) == total_ids:
-                percent_complete = ((idx + 1) / total_ids) * 100
-                print(f"   → Processed {idx + 1}/{total_ids} ({percent_complete:.1f}%)")
-                time.sleep(0.04)  # Simulate processing time
-
-        return total_ids
-
     # =======================
     # ADDITIONAL METHODS
     # =======================
@@ -649,8 +1438,9 @@ class SQLiteORM:
         Reset AUTOINCREMENT counter for a specific table.
         """
         try:
-            self.cursor.execute(f"DELETE FROM sqlite_sequence WHERE name='{table_name}';")
-            self.conn.commit()
+            # execute_query: the pool writer (or the open transaction), and commits on its own
+            if self.execute_query("DELETE FROM sqlite_sequence WHERE name = ?;", (table_name,)) is False:
+                return False
             print(f"✅ AUTOINCREMENT reset for table '{table_name}'")
             return True
         except sql.Error as e:
@@ -663,31 +1453,77 @@ class SQLiteORM:
         Reset AUTOINCREMENT counter for all tables.
         """
         try:
-            self.cursor.execute("DELETE FROM sqlite_sequence;")
-            self.conn.commit()
+            if self.execute_query("DELETE FROM sqlite_sequence;") is False:
+                return False
             print(f"✅ AUTOINCREMENT reset for all tables")
             return True
         except sql.Error as e:
             print(f"⚠️ Error resetting autoincrement for all tables: {e}")
             return False
 
+    # =======================
+    # PRAGMA PROFILES
+    # =======================
+    def apply_profile(self, name: str) -> None:
+
+        """
+        Snapshot the current values of the profile pragmas and apply the profile.
+        Every apply_profile must be paired with restore_profile (or use profile()).
+        Re-applying the profile that is already on top is a no-op.
+        """
+        settings = pragma_profiles.get_profile(name)
+
+        if self.pool is not None and not self.in_transaction():
+            self.pool.writer_lock.acquire() # held until restore_profile
+            if self.pool.writer_conn is None:
+                self.pool.writer_conn = self.pool.new_connection()
+            conn = self.pool.writer_conn
+        else:
+            conn = self.local.conn if self.in_transaction() else self.conn
+
+        if self.profiles and self.profiles[-1][0] == name:
+            self.profiles.append((name, conn, {}))
+            return
+
+        previous = pragma_profiles.snapshot(conn, settings.keys())
+        pragma_profiles.apply(conn, settings)
+        self.profiles.append((name, conn, previous))
+
+    def restore_profile(self) -> Union[str, None]:
+
+        if not self.profiles:
+            return None
+
+        name, conn, previous = self.profiles.pop()
+
+        try:
+            pragma_profiles.apply(conn, dict(reversed(list(previous.items()))))
+            if "locking_mode" in previous:
+                conn.execute("SELECT 1 FROM sqlite_master LIMIT 1;").fetchall() # releases an EXCLUSIVE lock
+        finally:
+            if self.pool is not None and conn is self.pool.writer_conn and not self.in_transaction():
+                self.pool.writer_lock.release()
+
+        return name
+
+    @contextmanager
+    def profile(self, name: str):
+
+        """
+        with db.profile("bulk"):
+            db.insert_many(...)
+        Profiles: stream, bulk, oltp, readonly (helpers/PragmaProfiles.py).
+        """
+        self.apply_profile(name)
+        try:
+            yield
+        finally:
+            self.restore_profile()
+
     def activate_stream(self) -> None:
 
-        if self.stream_mode:
-            print("eStream mode is already active.")
-            self.cursor.execute("PRAGMA synchronous = OFF;")
-            self.cursor.execute("PRAGMA journal_mode = MEMORY;")
-            self.cursor.execute("PRAGMA temp_store = MEMORY;")
-            self.cursor.execute("PRAGMA locking_mode = EXCLUSIVE;")
-            self.cursor.execute("PRAGMA foreign_keys = OFF;")
-            self.cursor.execute("PRAGMA cache_size = -2000000;")
-    
+        self.apply_profile("bulk")
+
     def desactivate_stream(self) -> None:
 
-        if self.stream_mode:
-            print("eStream mode is already deactivated.")
-            self.cursor.execute("PRAGMA foreign_keys = ON;")
-            self.cursor.execute("PRAGMA journal_mode = WAL;")
-            self.cursor.execute("PRAGMA synchronous = NORMAL;")
-    
-        
\ No newline at end of file
+        self.restore_profile()
@@ -0,0 +1,284 @@
+import heapq
+import itertools
+import os
+import queue
+import sqlite3 as sql
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+from SQLiteORM import SQLiteORM
+from helpers.QueryResults import QueryResults
+
+# AUTOINCREMENT ids of shard i start at i * ID_BLOCK, so ids stay unique across shards
+# and the shard of any id is id // ID_BLOCK
+ID_BLOCK = 1 << 40
+# SQLITE_MAX_ATTACHED of the default build
+MAX_ATTACHED = 10
+# insert_many: rows per hand-off to a shard, and hand-offs queued per shard
+HANDOFF_ROWS = 1000
+HANDOFF_DEPTH = 4
+END = object()
+
+
+def sort_key(column: str):
+
+    """
+    heapq.merge key ordering values like SQLite does: NULL < numbers < text < blobs,
+    so NULLs (and mixed types) never reach a None < int comparison. With reverse=True
+    it gives SQLite's DESC order (NULLs last).
+    """
+    def key(row):
+        value = row[column]
+        if value is None:
+            return (0, 0)
+        if isinstance(value, (int, float)):
+            return (1, value)
+        return (2, value) if isinstance(value, str) else (3, value)
+    return key
+
+
+def drain(handoff: queue.Queue):
+
+    while True:
+        rows = handoff.get()
+        if rows is END:
+            return
+        yield from rows
+
+
+def shard_paths(db_path: str, shards: int) -> list:
+
+    """
+    omnimind.db, 4 -> [omnimind.shard0.db, ..., omnimind.shard3.db]
+    """
+    base, ext = os.path.splitext(db_path)
+    return [f"{base}.shard{i}{ext or '.db'}" for i in range(shards)]
+
+
+class ShardedSQLiteORM:
+
+    """
+    N SQLite files behind one router: every row lives in the shard picked by
+    its shard key (e.g. id_user), so writes for different keys go to different
+    files and no longer queue behind a single writer lock.
+    - routed calls (key=...) hit one shard
+    - fan_out() runs a query on every shard in parallel and merges the rows in Python
+    - union() runs it once over ATTACHed shards with UNION ALL (up to MAX_ATTACHED shards)
+    Writes spanning several shards are not atomic across them.
+
+    db = ShardedSQLiteORM(shard_paths("omnimind.db", 4), shard_key="id_user")
+    db.connect()
+    db.execute("INSERT INTO tasks (id_user, title) VALUES (?, ?)", (7, "hi"), key=7)
+    db.fan_out("SELECT * FROM tasks WHERE state = ?", (0,), order_by="created_at", desc=True, limit=50)
+    """
+
+    def __init__(self, paths: list, shard_key: str = "id_user"):
+
+        if not paths:
+            raise ValueError("At least one shard path is required")
+        self.paths = list(paths)
+        self.shard_key = shard_key
+        self.shards = [SQLiteORM(path) for path in self.paths]
+        self.executor = ThreadPoolExecutor(max_workers=len(self.shards), thread_name_prefix="orm-shard")
+
+    def __len__(self) -> int:
+
+        return len(self.shards)
+
+    # ------------- connections -------------
+    def connect(self, pool_size: Union[int, None] = None) -> bool:
+
+        """
+        One connection per shard, or one pool per shard with pool_size (needed for parallel writes).
+        """
+        for shard in self.shards:
+            connected = shard.connect_pool(pool_size) if pool_size else shard.connect_DB()
+            if connected is None:
+                return False
+        return True
+
+    def close(self) -> None:
+
+        for shard in self.shards:
+            shard.close_connection()
+        self.executor.shutdown(wait=False)
+
+    # ------------- routing -------------
+    def shard_index(self, key) -> int:
+
+        """
+        Stable routing: integers by modulo, anything else by crc32 of its text.
+        """
+        if isinstance(key, bool) or not isinstance(key, int):
+            key = zlib.crc32(str(key).encode("utf-8"))
+        return key % len(self.shards)
+
+    def shard_for(self, key) -> SQLiteORM:
+
+        return self.shards[self.shard_index(key)]
+
+    def shard_for_id(self, row_id: int) -> SQLiteORM:
+
+        """
+        Shard of an AUTOINCREMENT id handed out after reserve_id_ranges().
+        """
+        return self.shards[row_id // ID_BLOCK]
+
+    def reserve_id_ranges(self, *tables) -> None:
+
+        """
+        Give each shard its own AUTOINCREMENT range (shard i: i * 2^40 ...) so ids from
+        different shards never collide. Run once, after the tables exist.
+        """
+        for index, shard in enumerate(self.shards):
+            start = index * ID_BLOCK
+            with shard.transaction() as conn:
+                for table in tables:
+                    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)).fetchone()
+                    if row is None:
+                        conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, start))
+                    elif row[0] < start:
+                        conn.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = ?", (start, table))
+
+    # ------------- writes -------------
+    def execute_all(self, query: str, params: Union[tuple, None] = None) -> bool:
+
+        """
+        Same statement on every shard (DDL, indexes, reference data).
+        """
+        return all(shard.execute_query(query, params) is not False for shard in self.shards)
+
+    def execute(self, query: str, params: Union[tuple, list, None] = None, key=None):
+
+        if key is None:
+            raise ValueError(f"A shard key value ({self.shard_key}) is required to route this statement, use execute_all() or fan_out()")
+        return self.shard_for(key).execute_query(query, params)
+
+    def insert(self, data: Union[tuple, list], table_name: str, key=None) -> bool:
+
+        """
+        Single row routed by `key`, or by the shard key column of the row.
+        """
+        if key is None:
+            key = data[self.key_position(table_name, with_pk=True)]
+        return self.shard_for(key).insert(data, table_name)
+
+    def insert_many(self, table_name: str, items, **options) -> bool:
+
+        """
+        Rows (without primary key, like SQLiteORM.insert_many) are routed as they are read:
+        each shard streams its rows into its own SQLiteORM.insert_many, in parallel, through a
+        bounded queue, so memory stays O(shards * HANDOFF_ROWS * HANDOFF_DEPTH) whatever `items` holds.
+        """
+        position = self.key_position(table_name, with_pk=False)
+        handoffs, buffers, futures = {}, {}, {}
+
+        def hand_off(index, rows):
+            # A shard that already failed stops reading: drop its rows instead of blocking
+            while not futures[index].done():
+                try:
+                    handoffs[index].put(rows, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        try:
+            for row in items:
+                index = self.shard_index(row[position])
+                if index not in handoffs:
+                    handoffs[index] = queue.Queue(maxsize=HANDOFF_DEPTH)
+                    buffers[index] = []
+                    futures[index] = self.executor.submit(self.shards[index].insert_many, table_name, drain(handoffs[index]), **options)
+                buffers[index].append(row)
+                if len(buffers[index]) >= HANDOFF_ROWS:
+                    hand_off(index, buffers[index])
+                    buffers[index] = []
+        finally:
+            # Also when reading `items` fails: every shard must see the end of its stream
+            for index, rows in buffers.items():
+                if rows:
+                    hand_off(index, rows)
+                hand_off(index, END)
+
+        return all(future.result() is not False for future in futures.values())
+
+    def key_position(self, table_name: str, with_pk: bool) -> int:
+
+        info = self.shards[0].table_info(table_name)
+        if not info:
+            raise ValueError(f"Table '{table_name}' does not exist.")
+        columns = info["columns"] if with_pk else [c for c in info["columns"] if c not in info["pk"]]
+        if self.shard_key not in columns:
+            raise ValueError(f"Table '{table_name}' has no shard key column '{self.shard_key}'")
+        return columns.index(self.shard_key)
+
+    # ------------- reads -------------
+    def select(self, query: str, params: Union[tuple, None] = None, key=None, **merge_options):
+
+        """
+        Routed when the shard key value is known, fanned out otherwise.
+        """
+        if key is not None:
+            return self.shard_for(key).execute_query(query, params)
+        return self.fan_out(query, params, **merge_options)
+
+    def fan_out(self, query: str, params: Union[tuple, None] = None, order_by: Union[str, None] = None,
+                desc: bool = False, limit: Union[int, None] = None) -> Union[QueryResults, bool]:
+
+        """
+        Run `query` on every shard in parallel (sqlite3 releases the GIL while stepping)
+        and merge the rows. With order_by, `query` should already ORDER BY that column on
+        each shard: the sorted shard results are merged lazily and cut at `limit`.
+        """
+        futures = [self.executor.submit(shard.execute_query, query, params) for shard in self.shards]
+        results = [future.result() for future in futures]
+        if any(result is False for result in results):
+            return False
+
+        rows_per_shard = [result.raw for result in results]
+        if order_by is None:
+            rows = list(itertools.chain.from_iterable(rows_per_shard))
+            rows = rows[:limit] if limit is not None else rows
+        else:
+            merged = heapq.merge(*rows_per_shard, key=sort_key(order_by), reverse=desc)
+            rows = list(itertools.islice(merged, limit))
+
+        return QueryResults(rows, formatter=self.shards[0].format_results)
+
+    def count(self, table_name: str, where: Union[str, None] = None, params: tuple = ()) -> int:
+
+        query = f"SELECT count(*) FROM {table_name}" + (f" WHERE {where}" if where else "")
+        result = self.fan_out(query, params)
+        return sum(row[0] for row in result.raw) if result else 0
+
+    def union(self, query_template: str, params: Union[tuple, None] = None, order_limit: str = ""):
+
+        """
+        Cross-shard read in a single statement: the shards are ATTACHed to a read connection
+        of the first one and "{db}" in the template becomes each schema name:
+        db.union("SELECT id_user, count(*) AS n FROM {db}.tasks GROUP BY id_user", order_limit="ORDER BY n DESC LIMIT 10")
+        `params` are repeated for every shard.
+        """
+        if len(self.shards) > MAX_ATTACHED + 1:
+            raise ValueError(f"ATTACH supports up to {MAX_ATTACHED} extra databases, use fan_out() for {len(self.shards)} shards")
+
+        schemas = ["main"] + [f"shard{i}" for i in range(1, len(self.shards))]
+        query = " UNION ALL ".join(query_template.format(db=schema) for schema in schemas)
+        if order_limit:
+            query = f"SELECT * FROM ({query}) {order_limit}"
+        query_params = tuple(params or ()) * len(schemas)
+
+        # Dedicated connection: ATTACH must not leak into the ORM connections
+        conn = sql.connect(self.paths[0])
+        conn.row_factory = sql.Row
+        try:
+            for schema, path in zip(schemas[1:], self.paths[1:]):
+                conn.execute("ATTACH DATABASE ? AS " + schema, (path,))
+            rows = conn.execute(query, query_params).fetchall()
+            return QueryResults(rows, formatter=self.shards[0].format_results)
+        except sql.Error as e:
+            print(f"⚠️ Query error: {e}")
+            return False
+        finally:
+            conn.close()
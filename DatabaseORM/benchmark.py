@@ -0,0 +1,412 @@
+"""
+Reproducible benchmark for SQLiteORM.
+
+    python benchmark.py                                 # 1k and 100k rows
+    python benchmark.py --sizes 1000 1000000 10000000 --output results.json
+    python benchmark.py --compare results_main.json     # flag regressions against a previous run
+    python benchmark.py --groups read --database productos.db ../OmniMind/server/conf/omnimind.db
+
+Every scenario runs on a fresh database filled with the same seeded synthetic
+data, so results from different commits can be compared key by key.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3 as sql
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from SQLiteORM import SQLiteORM
+
+TABLE = "productos"
+SCHEMA = f"""
+CREATE TABLE {TABLE} (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    price REAL NOT NULL,
+    stock INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+COLUMNS = "name, category, price, stock, created_at"
+CATEGORIES = ["food", "drinks", "cleaning", "electronics", "toys", "garden", "books", "sports"]
+
+# Row-at-a-time inserts are capped so the 10M run finishes in reasonable time
+SINGLE_INSERT_LIMIT = 10000
+# Read-mostly workload: random point lookups per table and per reader thread
+READ_LOOKUPS = 2000
+READ_THREADS = 4
+
+
+def generate_rows(n: int, seed: int = 42, start_id: int = 1):
+
+    """
+    Deterministic synthetic products: (id, name, category, price, stock, created_at).
+    """
+    rng = random.Random(seed)
+    for i in range(start_id, start_id + n):
+        yield (
+            i,
+            f"product_{i}_{rng.randrange(1_000_000):06d}",
+            CATEGORIES[rng.randrange(len(CATEGORIES))],
+            round(rng.uniform(0.5, 500.0), 2),
+            rng.randrange(0, 1000),
+            f"2024-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+        )
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool = True):
+
+    # The ORM reports every step with print(), keep it out of the timings
+    if not enabled:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+class Benchmark:
+
+    def __init__(self, sizes: list, repeat: int = 3, seed: int = 42, workdir: str = None, verbose: bool = False):
+
+        self.sizes = sizes
+        self.repeat = repeat
+        self.seed = seed
+        self.cleanup = workdir is None
+        self.workdir = workdir or tempfile.mkdtemp(prefix="orm_bench_")
+        self.verbose = verbose
+        self.results = []
+
+    # ------------- databases -------------
+    def db_path(self, name: str) -> str:
+
+        path = os.path.join(self.workdir, f"{name}.db")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        return path
+
+    def create(self, name: str, rows: int = 0, stream: bool = False) -> SQLiteORM:
+
+        """
+        Fresh database with the products table, prefilled with `rows` rows using raw executemany.
+        """
+        db = SQLiteORM(self.db_path(name))
+        with quiet():
+            db.connect_stream_DB() if stream else db.connect_DB()
+        db.cursor.execute(SCHEMA)
+        db.cursor.execute(f"CREATE INDEX idx_{TABLE}_category ON {TABLE} (category)")
+        if rows:
+            db.cursor.executemany(f"INSERT INTO {TABLE} VALUES (?, ?, ?, ?, ?, ?)", generate_rows(rows, self.seed))
+        db.conn.commit()
+        db.schema.invalidate()
+        return db
+
+    def close(self, db: SQLiteORM) -> None:
+
+        with quiet():
+            db.close_connection_stream_DB() if db.stream_mode else db.close_connection()
+
+    # ------------- measuring -------------
+    def measure(self, group: str, name: str, size: int, rows: int, setup, run, teardown=None) -> dict:
+
+        """
+        Best-of-`repeat` wall time of run(state); setup() builds fresh state for every repetition.
+        """
+        timings = []
+        for _ in range(self.repeat):
+            state = setup()
+            try:
+                with quiet(not self.verbose):
+                    started = time.perf_counter()
+                    run(state)
+                    timings.append(time.perf_counter() - started)
+            finally:
+                if teardown is not None:
+                    teardown(state)
+
+        best = min(timings)
+        result = {
+            "key": f"{group}.{name}.{size}",
+            "group": group,
+            "name": name,
+            "size": size,
+            "rows": rows,
+            "best_seconds": round(best, 6),
+            "median_seconds": round(statistics.median(timings), 6),
+            "rows_per_second": round(rows / best, 1) if best > 0 and rows else None,
+        }
+        self.results.append(result)
+        print(f"  {result['key']:<45} {best * 1000:>10.2f} ms  {result['rows_per_second'] or '':>14} rows/s")
+        return result
+
+    # ------------- scenarios -------------
+    def bench_insert(self, size: int) -> None:
+
+        # insert() takes the full row (id included), insert_many the non primary key columns
+        single = list(generate_rows(min(size, SINGLE_INSERT_LIMIT), self.seed))
+        rows = [row[1:] for row in generate_rows(size, self.seed)]
+
+        def fresh(stream=False):
+            return lambda: self.create("insert", stream=stream)
+
+        def insert(db):
+            for row in single:
+                db.insert(row, TABLE)
+
+        def executemany(db):
+            db.cursor.executemany(f"INSERT INTO {TABLE} ({COLUMNS}) VALUES (?, ?, ?, ?, ?)", rows)
+            db.conn.commit()
+
+        self.measure("insert", "insert", size, len(single), fresh(), insert, self.close)
+        self.measure("insert", "insert_many", size, size, fresh(), lambda db: db.insert_many(TABLE, rows), self.close)
+        self.measure("insert", "insert_many_multi_values", size, size, fresh(),
+                     lambda db: db.insert_many(TABLE, rows, multi_values=True), self.close)
+        self.measure("insert", "raw_executemany", size, size, fresh(), executemany, self.close)
+
+        # Same work under the normal and the stream pragmas
+        self.measure("pragmas", "insert_many_normal", size, size, fresh(), lambda db: db.insert_many(TABLE, rows), self.close)
+        self.measure("pragmas", "insert_many_stream", size, size, fresh(stream=True), lambda db: db.insert_many(TABLE, rows), self.close)
+
+    def bench_select(self, size: int) -> None:
+
+        db = self.create("select", size)
+        ids = random.Random(self.seed).sample(range(1, size + 1), min(size, 1000))
+        in_values = list(range(1, size + 1, max(1, size // 5000)))
+
+        def keep():
+            return db
+
+        def lookups(db):
+            for i in ids:
+                db.select_by_id(TABLE, "id", i)
+
+        def stream(db):
+            for _ in db.iter_query(f"SELECT * FROM {TABLE}", batch_size=5000):
+                pass
+
+        def keyset(db):
+            for _ in db.iter_keyset(TABLE, batch_size=5000):
+                pass
+
+        try:
+            self.measure("select", "select_all", size, size, keep, lambda db: db.select_all(TABLE))
+            self.measure("select", "select_columns", size, size, keep, lambda db: db.select_columns(TABLE, ["id", "price"]))
+            self.measure("select", "select_where", size, size // len(CATEGORIES), keep, lambda db: db.select_where(TABLE, category="food"))
+            self.measure("select", "select_by_id_x1000", size, len(ids), keep, lookups)
+            self.measure("select", "select_like", size, size, keep, lambda db: db.select_like(TABLE, "name", "product_1%"))
+            self.measure("select", "select_in", size, len(in_values), keep, lambda db: db.select_in(TABLE, "id", in_values))
+            self.measure("select", "iter_query", size, size, keep, stream)
+            self.measure("select", "iter_keyset", size, size, keep, keyset)
+
+            # Same reads with generated row classes instead of sqlite3.Row
+            db.enable_row_mapping(TABLE)
+            self.measure("select", "select_all_mapped", size, size, keep, lambda db: db.select_all(TABLE))
+            self.measure("select", "iter_query_mapped", size, size, keep, stream)
+        finally:
+            self.close(db)
+
+    def bench_delete(self, size: int) -> None:
+
+        half = size // 2
+        ids = list(range(1, size + 1, 2))
+
+        def fresh():
+            return self.create("delete", size)
+
+        self.measure("delete", "id_list", size, len(ids), fresh, lambda db: db.delete(ids, TABLE), self.close)
+        self.measure("delete", "operator", size, half, fresh, lambda db: db.delete(["id", "<=", half], TABLE), self.close)
+        self.measure("delete", "between", size, half, fresh, lambda db: db.delete(["id", "BETWEEN", (1, half)], TABLE), self.close)
+        self.measure("delete", "raw_delete", size, half, fresh,
+                     lambda db: (db.cursor.execute(f"DELETE FROM {TABLE} WHERE id <= ?", (half,)), db.conn.commit()), self.close)
+
+    def bench_read(self, size: int) -> None:
+
+        db = self.create("read", size)
+        self.close(db)
+        self.read_modes(db.db_path, str(size))
+
+    def bench_read_database(self, path: str) -> None:
+
+        """
+        Read group against a copy of an existing database (the original file is never opened).
+        """
+        label = os.path.splitext(os.path.basename(path))[0]
+        copy = self.db_path(f"read_{label}")
+        for suffix in ("", "-wal"):
+            if os.path.exists(path + suffix):
+                shutil.copyfile(path + suffix, copy + suffix)
+        self.read_modes(copy, label)
+
+    def read_modes(self, path: str, label: str) -> None:
+
+        """
+        Same read-mostly workload with the default connection vs connect_read_DB,
+        then READ_THREADS concurrent readers on connect_pool vs connect_pool(read_optimized=True).
+        """
+        with sql.connect(path) as conn:
+            tables, total_rows = {}, 0
+            for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"):
+                try:
+                    rowids = [r[0] for r in conn.execute(f"SELECT rowid FROM {table}")]
+                except sql.Error:
+                    continue # WITHOUT ROWID
+                total_rows += len(rowids)
+                if rowids:
+                    rng = random.Random(self.seed)
+                    tables[table] = [rng.choice(rowids) for _ in range(READ_LOOKUPS)]
+        conn.close()
+
+        if not tables:
+            print(f"  (no tables with rows in {path})")
+            return
+
+        lookups = READ_LOOKUPS * len(tables)
+
+        def workload(db):
+            for table, ids in tables.items():
+                query = f"SELECT * FROM {table} WHERE rowid = ?"
+                for rowid in ids:
+                    db.execute_query(query, (rowid,))
+                for _ in db.iter_query(f"SELECT * FROM {table}", batch_size=5000):
+                    pass
+
+        def concurrent(db):
+            threads = [threading.Thread(target=workload, args=(db,)) for _ in range(READ_THREADS)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for name, connect in (("default", SQLiteORM.connect_DB), ("read_optimized", SQLiteORM.connect_read_DB)):
+            db = SQLiteORM(path)
+            with quiet():
+                connect(db)
+            try:
+                self.measure("read", name, label, lookups + total_rows, lambda: db, workload)
+            finally:
+                self.close(db)
+
+        for name, options in (("pool_default", {}), ("pool_read_optimized", {"read_optimized": True}),
+                              ("pool_shared_cache", {"read_optimized": True, "shared_cache": True})):
+            db = SQLiteORM(path)
+            with quiet():
+                db.connect_pool(READ_THREADS, **options)
+            try:
+                self.measure("read", name, label, (lookups + total_rows) * READ_THREADS, lambda: db, concurrent)
+            finally:
+                self.close(db)
+
+    def run(self, groups: list, databases: list = None) -> dict:
+
+        started = time.time()
+        try:
+            for size in self.sizes:
+                print(f"\n== {size:,} rows ==")
+                for group in groups:
+                    getattr(self, f"bench_{group}")(size)
+            for path in databases or []:
+                print(f"\n== {path} ==")
+                self.bench_read_database(path)
+        finally:
+            if self.cleanup:
+                shutil.rmtree(self.workdir, ignore_errors=True)
+
+        return {
+            "meta": metadata(),
+            "config": {"sizes": self.sizes, "repeat": self.repeat, "seed": self.seed, "groups": groups, "databases": databases or []},
+            "total_seconds": round(time.time() - started, 3),
+            "results": self.results,
+        }
+
+
+def metadata() -> dict:
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "sqlite": sql.sqlite_version,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.10) -> list:
+
+    """
+    Results more than `threshold` slower than the baseline (same key).
+    """
+    previous = {r["key"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get(result["key"])
+        if not before or not before["best_seconds"]:
+            continue
+        change = result["best_seconds"] / before["best_seconds"] - 1
+        if change > threshold:
+            regressions.append({
+                "key": result["key"],
+                "baseline_seconds": before["best_seconds"],
+                "current_seconds": result["best_seconds"],
+                "change": round(change, 3),
+            })
+    return regressions
+
+
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="SQLiteORM benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000], help="row counts (1k .. 10M)")
+    parser.add_argument("--groups", nargs="+", default=["insert", "select", "delete"], choices=["insert", "select", "delete", "read"])
+    parser.add_argument("--database", nargs="+", default=[], help="existing databases for the read workload (a copy is benchmarked)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", default=None, help="where the benchmark databases are created")
+    parser.add_argument("--output", default=None, help="JSON file for the results (default: stdout)")
+    parser.add_argument("--compare", default=None, help="previous JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as regression")
+    parser.add_argument("--verbose", action="store_true", help="keep the ORM output")
+    args = parser.parse_args()
+
+    report = Benchmark(args.sizes, args.repeat, args.seed, args.workdir, args.verbose).run(args.groups, args.database)
+
+    status = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["baseline"] = baseline.get("meta")
+        report["regressions"] = compare(report, baseline, args.threshold)
+        for r in report["regressions"]:
+            print(f"⚠️ Regression {r['key']}: {r['baseline_seconds']}s -> {r['current_seconds']}s (+{r['change'] * 100:.1f}%)")
+        status = 1 if report["regressions"] else 0
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import time
+
+
+class AdaptiveBatcher:
+
+    """
+    Chunk size that tunes itself from measured latency:
+    every recorded chunk moves `size` toward the number of rows that would
+    take `target_seconds`, changing by at most `max_step`x per chunk.
+    """
+
+    def __init__(self, initial: int = 1000, target_seconds: float = 0.25, min_size: int = 50, max_size: int = 200_000, max_step: float = 2.0):
+
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.size = min(max(initial, self.min_size), self.max_size)
+        self.target_seconds = target_seconds
+        self.max_step = max_step
+        self.rows = 0
+        self.chunks = 0
+        self.elapsed = 0.0
+        self.started = time.perf_counter()
+
+    def record(self, rows: int, elapsed: float) -> int:
+
+        self.rows += rows
+        self.chunks += 1
+        self.elapsed += elapsed
+
+        # Tiny/partial chunks carry no useful signal
+        if rows < self.size or elapsed <= 0:
+            return self.size
+
+        factor = self.target_seconds / elapsed
+        factor = min(max(factor, 1 / self.max_step), self.max_step)
+        self.size = int(min(max(self.size * factor, self.min_size), self.max_size))
+        return self.size
+
+    @property
+    def rows_per_second(self) -> float:
+
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def stats(self) -> dict:
+
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "chunk_size": self.size,
+            "db_seconds": round(self.elapsed, 4),
+            "wall_seconds": round(time.perf_counter() - self.started, 4),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
@@ -0,0 +1,119 @@
+import os
+import sqlite3 as sql
+import threading
+import queue
+from contextlib import contextmanager
+from urllib.parse import quote
+
+import helpers.PragmaProfiles as pragma_profiles
+
+
+class ConnectionPool:
+
+    """
+    Bounded pool of SQLite connections with a WAL reader/writer split:
+    - readers: up to `size` connections checked out concurrently (query_only)
+    - writer: a single connection, serialized through a lock
+    reader_settings: pragmas applied to every reader (e.g. PragmaProfiles.read_profile)
+    shared_cache: readers share one page cache instead of one cache each
+    """
+
+    def __init__(self, db_path: str, size: int = 5, timeout: float = 30.0, reader_settings: dict = None, shared_cache: bool = False):
+
+        self.db_path = db_path
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self.reader_settings = reader_settings
+        self.shared_cache = shared_cache
+        self.row_factory = sql.Row
+        self.readers = queue.LifoQueue(maxsize=self.size)
+        self.created = 0
+        self.lock = threading.Lock()
+        self.writer_lock = threading.RLock()
+        self.writer_conn = None
+        self.closed = False
+
+    def new_connection(self, readonly: bool = False) -> sql.Connection:
+
+        if readonly and self.shared_cache:
+            uri = f"file:{quote(os.path.abspath(self.db_path))}?cache=shared"
+            conn = sql.connect(uri, uri=True, check_same_thread=False, timeout=self.timeout)
+        else:
+            conn = sql.connect(self.db_path, check_same_thread=False, timeout=self.timeout)
+        conn.row_factory = self.row_factory
+        conn.execute("PRAGMA journal_mode=WAL;").fetchall() # readers never block the writer (and vice versa)
+        if readonly:
+            pragma_profiles.apply(conn, self.reader_settings or {"query_only": "ON"})
+        return conn
+
+    def checkout(self) -> sql.Connection:
+
+        if self.closed:
+            raise sql.ProgrammingError("Connection pool is closed")
+
+        try:
+            return self.readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            if self.created < self.size:
+                self.created += 1
+                try:
+                    return self.new_connection(readonly=True)
+                except sql.Error:
+                    self.created -= 1
+                    raise
+
+        try:
+            return self.readers.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sql.OperationalError(f"No reader connection available after {self.timeout}s (pool size {self.size})")
+
+    def checkin(self, conn: sql.Connection) -> None:
+
+        if self.closed:
+            conn.close()
+            return
+
+        if conn.in_transaction:
+            conn.rollback()
+        self.readers.put_nowait(conn)
+
+    @contextmanager
+    def reader(self):
+
+        conn = self.checkout()
+        conn.row_factory = self.row_factory
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+
+    @contextmanager
+    def writer(self):
+
+        with self.writer_lock:
+            if self.closed:
+                raise sql.ProgrammingError("Connection pool is closed")
+            if self.writer_conn is None:
+                self.writer_conn = self.new_connection()
+            self.writer_conn.row_factory = self.row_factory
+            yield self.writer_conn
+
+    def close(self) -> None:
+
+        self.closed = True
+
+        while True:
+            try:
+                self.readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+        with self.writer_lock:
+            if self.writer_conn is not None:
+                self.writer_conn.close()
+                self.writer_conn = None
+
+        self.created = 0
@@ -0,0 +1,164 @@
+import csv
+import json
+import os
+import re
+
+# Streaming readers/writers used by SQLiteORM.import_file / export_table.
+# Parquet needs pyarrow, which is only imported when a .parquet file is used.
+
+FORMATS = {
+    ".csv": "csv",
+    ".txt": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+INTEGER_RE = re.compile(r"^[-+]?\d+$")
+REAL_RE = re.compile(r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$")
+
+
+def detect_format(path: str, format: str = None) -> str:
+
+    if format:
+        return format.lower()
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Unknown file format for '{path}', pass format='csv' | 'jsonl' | 'parquet'")
+    return FORMATS[ext]
+
+
+def column_name(name: str) -> str:
+
+    """
+    'Market Cap' -> 'Market_Cap', '% 1h' -> 'c_1h', 'volume (24h)' -> 'volume_24h'
+    """
+    clean = re.sub(r"\W+", "_", str(name).strip()).strip("_") or "column"
+    return f"c_{clean}" if clean[0].isdigit() else clean
+
+
+def coerce_value(value):
+
+    """
+    CSV cells arrive as text: turn numbers back into int/float and "" into NULL.
+    """
+    if not isinstance(value, str):
+        return value
+    if value == "":
+        return None
+    if INTEGER_RE.match(value) and not (len(value.lstrip("+-")) > 1 and value.lstrip("+-")[0] == "0"):
+        return int(value)
+    if REAL_RE.match(value):
+        return float(value)
+    return value
+
+
+def read_rows(path: str, format: str = None, batch_size: int = 10000, delimiter: str = ",", encoding: str = "utf-8") -> tuple:
+
+    """
+    Returns (header, rows) where rows is a lazy iterator of tuples.
+    """
+    format = detect_format(path, format)
+
+    if format == "csv":
+        handle = open(path, newline="", encoding=encoding)
+        reader = csv.reader(handle, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            handle.close()
+            return [], iter(())
+
+        def rows():
+            with handle:
+                for row in reader:
+                    yield tuple(coerce_value(v) for v in row)
+
+        return header, rows()
+
+    if format == "jsonl":
+        handle = open(path, encoding=encoding)
+        first = None
+        for line in handle:
+            if line.strip():
+                first = json.loads(line)
+                break
+        if first is None:
+            handle.close()
+            return [], iter(())
+        header = list(first.keys())
+
+        def rows():
+            with handle:
+                yield tuple(first.get(k) for k in header)
+                for line in handle:
+                    if line.strip():
+                        obj = json.loads(line)
+                        yield tuple(obj.get(k) for k in header)
+
+        return header, rows()
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        header = list(parquet.schema_arrow.names)
+
+        def rows():
+            for batch in parquet.iter_batches(batch_size=batch_size):
+                columns = [batch.column(i).to_pylist() for i in range(batch.num_columns)]
+                yield from zip(*columns)
+
+        return header, rows()
+
+    raise ValueError(f"Unsupported format '{format}'")
+
+
+def write_rows(path: str, header: list, rows, format: str = None, batch_size: int = 10000, delimiter: str = ",", encoding: str = "utf-8") -> int:
+
+    """
+    Stream `rows` (iterable of tuples) into `path`, returns the number of rows written.
+    """
+    format = detect_format(path, format)
+    written = 0
+
+    if format == "csv":
+        with open(path, "w", newline="", encoding=encoding) as handle:
+            writer = csv.writer(handle, delimiter=delimiter)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow(tuple(row))
+                written += 1
+        return written
+
+    if format == "jsonl":
+        with open(path, "w", encoding=encoding) as handle:
+            for row in rows:
+                handle.write(json.dumps(dict(zip(header, tuple(row))), ensure_ascii=False, default=str) + "\n")
+                written += 1
+        return written
+
+    if format == "parquet":
+        import itertools
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        rows = iter(rows)
+        try:
+            while True:
+                batch = [tuple(row) for row in itertools.islice(rows, batch_size)]
+                if not batch:
+                    break
+                table = pa.Table.from_pydict({name: list(col) for name, col in zip(header, zip(*batch))})
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+                written += len(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+        return written
+
+    raise ValueError(f"Unsupported format '{format}'")
@@ -0,0 +1,147 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+
+class GroupCommitWriter:
+
+    """
+    Group commit for many small writes: callers enqueue statements and get a
+    Future; a background thread flushes the queue in ONE transaction every
+    `max_delay_ms` or as soon as `max_rows` statements are waiting, and only
+    resolves the futures once that transaction is committed.
+    Each statement runs in its own SAVEPOINT, so a failing one only fails its own future.
+
+    Use it with connect_pool() (the flush holds the pool writer); with a single
+    connection, route every write through it so nothing else commits mid-batch.
+    """
+
+    STOP = object()
+
+    def __init__(self, orm, max_rows: int = 500, max_delay_ms: float = 5.0):
+
+        self.orm = orm
+        self.max_rows = max(1, max_rows)
+        self.max_delay = max_delay_ms / 1000
+        self.queue = queue.Queue()
+        self.flushes = 0
+        self.statements = 0
+        self.thread = threading.Thread(target=self.run, name="orm-group-commit", daemon=True)
+        self.running = True
+        self.thread.start()
+
+    def submit(self, query: str, params: tuple = ()) -> Future:
+
+        """
+        Future resolves to {"rowcount", "lastrowid"} after the batch commit.
+        """
+        future = Future()
+        if not self.running:
+            future.set_exception(RuntimeError("Group commit writer is stopped"))
+            return future
+        self.queue.put((query, tuple(params or ()), future))
+        return future
+
+    def run(self) -> None:
+
+        while True:
+            item = self.queue.get()
+            if item is self.STOP:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            stop = False
+
+            while len(batch) < self.max_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self.STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self.safe_flush(batch)
+
+            if stop:
+                self.drain()
+                return
+
+    def drain(self) -> None:
+
+        pending = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self.STOP:
+                pending.append(item)
+        for start in range(0, len(pending), self.max_rows):
+            self.safe_flush(pending[start : start + self.max_rows])
+
+    def safe_flush(self, batch: list) -> None:
+
+        # Whatever goes wrong, the writer thread survives and no caller is left waiting
+        try:
+            self.flush(batch)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    def flush(self, batch: list) -> None:
+
+        results = []
+        try:
+            with self.orm.transaction() as conn:
+                for query, params, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with self.orm.transaction():
+                            cursor = conn.execute(query, params)
+                            result = {"rowcount": cursor.rowcount, "lastrowid": cursor.lastrowid}
+                    except Exception as e:
+                        future.set_exception(e)
+                        continue
+                    # Only once RELEASE succeeded: a failed release already failed the future
+                    results.append((future, result))
+        except Exception as e:
+            # BEGIN or COMMIT failed: nothing in the batch is durable, and every
+            # future not already resolved (failed statement, cancelled) must fail
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.flushes += 1
+        self.statements += len(results)
+        for future, result in results:
+            future.set_result(result)
+
+    def stop(self, timeout: float = None) -> None:
+
+        """
+        Flush everything already queued, then stop the background thread.
+        """
+        if not self.running:
+            return
+        self.running = False
+        self.queue.put(self.STOP)
+        self.thread.join(timeout)
+
+        # Submitted while stopping: fail instead of leaving callers waiting forever
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self.STOP:
+                item[2].set_exception(RuntimeError("Group commit writer is stopped"))
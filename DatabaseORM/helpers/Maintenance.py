@@ -0,0 +1,208 @@
+import glob
+import os
+import sqlite3 as sql
+import threading
+import time
+
+
+class MaintenanceService:
+
+    """
+    Background upkeep for a long-running database, on its own connection so
+    the ORM connections (and their transactions) are never touched:
+    - backup/snapshot: online copy through the sqlite3 backup API, `pages` at a time
+    - checkpoint: PRAGMA wal_checkpoint (PASSIVE by default, never waits on readers or writers)
+    - vacuum: PRAGMA incremental_vacuum in short transactions (auto_vacuum = INCREMENTAL only)
+    - optimize: PRAGMA optimize with a bounded analysis_limit, or a full ANALYZE
+
+    Intervals are in seconds, None disables the task; start() runs them on a daemon thread.
+    """
+
+    def __init__(self, db_path: str, checkpoint_interval: float = 60, vacuum_interval: float = 300,
+                 optimize_interval: float = 3600, pages_per_step: int = 1000, busy_timeout: float = 5.0):
+
+        self.db_path = db_path
+        self.pages_per_step = pages_per_step
+        self.busy_timeout = busy_timeout
+        self.intervals = {
+            "checkpoint": checkpoint_interval,
+            "vacuum": vacuum_interval,
+            "optimize": optimize_interval,
+        }
+        now = time.monotonic()
+        self.next_run = {task: now + interval for task, interval in self.intervals.items() if interval}
+        self.history = {} # task -> {"at", "seconds", "result" | "error"}
+        self.lock = threading.Lock() # one task at a time on self.conn
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.conn = None
+
+    def connection(self) -> sql.Connection:
+
+        if self.conn is None:
+            self.conn = sql.connect(self.db_path, check_same_thread=False, timeout=self.busy_timeout, isolation_level=None)
+        return self.conn
+
+    # ------------- tasks -------------
+    def checkpoint(self, mode: str = "PASSIVE") -> dict:
+
+        """
+        PASSIVE copies what it can without waiting; TRUNCATE/RESTART also shrink the -wal file
+        but wait for readers, use them off-peak.
+        """
+        mode = mode.upper()
+        if mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+            raise ValueError(f"Unknown checkpoint mode '{mode}'")
+
+        with self.lock:
+            busy, log, checkpointed = self.connection().execute(f"PRAGMA wal_checkpoint({mode});").fetchone()
+        return {"mode": mode, "busy": bool(busy), "wal_pages": log, "checkpointed_pages": checkpointed}
+
+    def vacuum(self, max_pages: int = None) -> int:
+
+        """
+        Release free pages in steps of `pages_per_step`, each in its own short write transaction.
+        """
+        released = 0
+        with self.lock:
+            conn = self.connection()
+            if conn.execute("PRAGMA auto_vacuum;").fetchone()[0] != 2:
+                return 0
+
+            while max_pages is None or released < max_pages:
+                free = conn.execute("PRAGMA freelist_count;").fetchone()[0]
+                if not free:
+                    break
+                step = min(free, self.pages_per_step, max_pages - released if max_pages else free)
+                conn.execute("BEGIN IMMEDIATE;")
+                try:
+                    conn.execute(f"PRAGMA incremental_vacuum({step});").fetchall()
+                    conn.execute("COMMIT;")
+                except sql.Error:
+                    conn.execute("ROLLBACK;")
+                    raise
+                released += step
+        return released
+
+    def optimize(self, analyze: bool = False, analysis_limit: int = 400) -> str:
+
+        """
+        PRAGMA optimize only re-analyzes what changed, analysis_limit bounds the rows read per index;
+        analyze=True runs a full ANALYZE instead.
+        """
+        with self.lock:
+            conn = self.connection()
+            if analyze:
+                conn.execute("ANALYZE;")
+                return "ANALYZE"
+            if sql.sqlite_version_info >= (3, 32, 0):
+                conn.execute(f"PRAGMA analysis_limit = {int(analysis_limit)};").fetchall()
+            conn.execute("PRAGMA optimize;").fetchall()
+            return "optimize"
+
+    def backup(self, target_path: str, pages: int = 1024, sleep: float = 0.005, progress=None) -> dict:
+
+        """
+        Online copy of the live database. The backup API copies `pages` pages per step and
+        releases the source between steps (backing off `sleep` seconds when it is busy), so
+        readers and writers keep going; the copy goes to a temporary file moved into place at the end.
+        """
+        started = time.perf_counter()
+        tmp_path = f"{target_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        # Dedicated source connection: the step loop must not hold self.lock for minutes
+        source = sql.connect(self.db_path, timeout=self.busy_timeout)
+        target = sql.connect(tmp_path)
+        try:
+            source.backup(target, pages=pages, sleep=sleep, progress=progress)
+            total = target.execute("PRAGMA page_count;").fetchone()[0]
+        finally:
+            target.close()
+            source.close()
+
+        os.replace(tmp_path, target_path)
+        return {
+            "path": target_path,
+            "pages": total,
+            "bytes": os.path.getsize(target_path),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    def snapshot(self, directory: str, keep: int = 5, pages: int = 1024) -> dict:
+
+        """
+        Timestamped backup in `directory`, keeping the `keep` most recent snapshots.
+        """
+        os.makedirs(directory, exist_ok=True)
+        name = os.path.splitext(os.path.basename(self.db_path))[0]
+        result = self.backup(os.path.join(directory, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.db"), pages=pages)
+
+        snapshots = sorted(glob.glob(os.path.join(directory, f"{name}-*.db")))
+        for old in snapshots[:-keep] if keep else []:
+            os.remove(old)
+        result["kept"] = min(len(snapshots), keep) if keep else len(snapshots)
+        return result
+
+    # ------------- scheduling -------------
+    def run_task(self, task: str):
+
+        started = time.perf_counter()
+        entry = {"at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        try:
+            entry["result"] = getattr(self, task)()
+        except sql.Error as e:
+            # Busy or locked: try again on the next interval
+            entry["error"] = str(e)
+        entry["seconds"] = round(time.perf_counter() - started, 3)
+        self.history[task] = entry
+        return entry
+
+    def run_pending(self) -> list:
+
+        """
+        Run every task whose interval has elapsed; returns the names of the tasks run.
+        """
+        ran = []
+        now = time.monotonic()
+        for task, due in list(self.next_run.items()):
+            if now >= due:
+                self.run_task(task)
+                self.next_run[task] = time.monotonic() + self.intervals[task]
+                ran.append(task)
+        return ran
+
+    def loop(self, tick: float) -> None:
+
+        while not self.stop_event.wait(tick):
+            self.run_pending()
+
+    def start(self, tick: float = 1.0) -> None:
+
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.loop, args=(tick,), name="orm-maintenance", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    def status(self) -> dict:
+
+        now = time.monotonic()
+        return {
+            "running": self.thread is not None and self.thread.is_alive(),
+            "intervals": dict(self.intervals),
+            "next_run_in": {task: round(max(0.0, due - now), 1) for task, due in self.next_run.items()},
+            "history": dict(self.history),
+        }
@@ -0,0 +1,109 @@
+import os
+import sqlite3 as sql
+
+from helpers.utils import available_memory
+
+# Named PRAGMA profiles. Order matters: pragmas are applied top to bottom
+# and restored bottom to top.
+PROFILES = {
+    # connect_stream_DB: whole connection dedicated to ingest, nothing else may touch the file
+    "stream": {
+        "synchronous": "OFF",
+        "journal_mode": "MEMORY",
+        "temp_store": "MEMORY",
+        "locking_mode": "EXCLUSIVE",
+        "foreign_keys": "OFF",
+        "cache_size": "-2000000",
+        "automatic_index": "OFF",
+        "cache_spill": "OFF",
+    },
+    # Scoped bulk work (insert_many, delete, import_file) on a shared WAL database.
+    # foreign_keys stays as is so ON DELETE CASCADE keeps working in delete().
+    # The whole load is one transaction: a bounded cache that may spill keeps memory
+    # flat whatever the row count (an unbounded, non-spilling one holds every dirty page)
+    "bulk": {
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+        "cache_size": "-64000",
+        "cache_spill": "ON",
+    },
+    # Default request/response workload
+    "oltp": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "DEFAULT",
+        "foreign_keys": "ON",
+        "cache_size": "-2000",
+        "busy_timeout": "5000",
+    },
+    "readonly": {
+        "query_only": "ON",
+        "temp_store": "MEMORY",
+        "cache_size": "-64000",
+    },
+}
+
+# SQLITE_MAX_MMAP_SIZE of the default build, larger mmap_size values are silently clamped
+MMAP_LIMIT = 0x7FFF0000
+MB = 1024 * 1024
+
+# Pragmas that only read the database file or the schema: the only ones routed to the
+# query_only reader connections. Everything else (optimize, wal_checkpoint, incremental_vacuum,
+# connection settings whose value differs per connection) goes to the writer.
+READ_ONLY = frozenset({
+    "application_id", "collation_list", "compile_options", "data_version", "database_list",
+    "foreign_key_check", "foreign_key_list", "freelist_count", "function_list", "index_info",
+    "index_list", "index_xinfo", "integrity_check", "module_list", "page_count", "page_size",
+    "pragma_list", "quick_check", "schema_version", "table_info", "table_list", "table_xinfo",
+    "user_version",
+})
+
+# SQLite ignores or rejects these while a transaction is open
+TRANSACTION_LOCKED = ("synchronous", "journal_mode", "locking_mode", "foreign_keys")
+
+
+def get_profile(name: str) -> dict:
+
+    if name not in PROFILES:
+        raise ValueError(f"Unknown pragma profile '{name}', choose one of: {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+def snapshot(conn: sql.Connection, names) -> dict:
+
+    previous = {}
+    for name in names:
+        row = conn.execute(f"PRAGMA {name};").fetchone()
+        if row is not None:
+            previous[name] = row[0]
+    return previous
+
+
+def apply(conn: sql.Connection, settings: dict) -> None:
+
+    for name, value in settings.items():
+        if conn.in_transaction and name in TRANSACTION_LOCKED:
+            continue
+        conn.execute(f"PRAGMA {name} = {value};").fetchall()
+
+
+def read_profile(db_path: str, connections: int = 1, memory_fraction: float = 0.25) -> dict:
+
+    """
+    "readonly" sized for this database and this machine:
+    - mmap_size: the DB file (+25% room to grow), so reads are served from the OS page cache without copies
+    - cache_size: `memory_fraction` of the available RAM split between `connections`,
+      never more than the file itself and never less than 8 MB (sorts, temp b-trees)
+    """
+    size = 0
+    for suffix in ("", "-wal"):
+        if os.path.exists(db_path + suffix):
+            size += os.path.getsize(db_path + suffix)
+
+    mmap_size = min(MMAP_LIMIT, -(-(size + size // 4) // (16 * MB)) * 16 * MB)
+
+    memory = available_memory()
+    budget = int(memory * memory_fraction) // max(1, connections) if memory else 64 * MB
+    cache_bytes = max(8 * MB, min(budget, size))
+
+    return dict(PROFILES["readonly"], mmap_size=str(mmap_size), cache_size=str(-(cache_bytes // 1024)))
@@ -0,0 +1,300 @@
+from typing import Union
+
+from helpers.utils import SQLITE_MAX_VARIABLES
+from helpers.QueryResults import QueryResults
+
+OPERATORS = ("=", "!=", "<>", "<", ">", "<=", ">=", "LIKE", "NOT LIKE", "GLOB", "IN", "NOT IN", "BETWEEN", "IS NULL", "IS NOT NULL")
+AGGREGATES = ("COUNT", "SUM", "AVG", "MIN", "MAX", "TOTAL", "GROUP_CONCAT")
+
+
+def in_bucket(n: int) -> int:
+
+    """
+    Round IN-list sizes up to a power of two (min 8) so a handful of compiled
+    shapes cover every list length; the padding repeats the last value.
+    """
+    size = 8
+    while size < n:
+        size *= 2
+    return size
+
+
+class QueryBuilder:
+
+    """
+    Fluent SELECT builder. SQL is compiled once per query shape (tables, columns,
+    operators, clause layout, IN-list bucket) and cached in the ORM's statement
+    cache; only the parameters change between calls.
+
+    db.table("tasks").where("id_user", 3).where("state", "=", 0) \\
+        .order_by("created_at", desc=True).limit(20).all()
+    """
+
+    def __init__(self, orm, table: str):
+
+        self.orm = orm
+        self.table = table
+        self.columns = []
+        self.is_distinct = False
+        self.joins = []
+        self.conditions = [] # (sql, params)
+        self.groups = []
+        self.havings = []
+        self.orders = []
+        self.limit_value = None
+        self.offset_value = None
+        self.in_values = None # (column, values, negate) of the IN list that may need chunking
+
+    # ------------- building -------------
+    def select(self, *columns):
+        self.columns.extend(columns)
+        return self
+
+    def distinct(self, value: bool = True):
+        self.is_distinct = value
+        return self
+
+    def aggregate(self, function: str, column: str = "*", alias: str = None):
+        function = function.upper()
+        if function not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate '{function}', use one of: {', '.join(AGGREGATES)}")
+        expression = f"{function}({column})"
+        self.columns.append(f"{expression} AS {alias}" if alias else expression)
+        return self
+
+    def join(self, table: str, on: str, kind: str = "INNER"):
+        self.joins.append(f" {kind.upper()} JOIN {table} ON {on}")
+        return self
+
+    def left_join(self, table: str, on: str):
+        return self.join(table, on, "LEFT")
+
+    def where(self, column: str = None, op_or_value=None, value=None, /, **conditions):
+
+        """
+        where("id", 3) | where("price", ">", 10) | where("name", "LIKE", "a%")
+        where("id", "IN", [1, 2]) | where("date", "BETWEEN", (d1, d2))
+        where("token", "IS NULL") | where("token", None) | where(id_user=3, state=0)
+        Positional-only, so columns named column / value work as keywords; keywords are always "=".
+        """
+        if column is not None:
+            if op_or_value is None and value is None:
+                self.conditions.append((f"{column} IS NULL", ()))
+            elif value is None and isinstance(op_or_value, str) and op_or_value.upper() in ("IS NULL", "IS NOT NULL"):
+                self.conditions.append((f"{column} {op_or_value.upper()}", ()))
+            elif value is None and not (isinstance(op_or_value, str) and op_or_value.upper() in OPERATORS):
+                self.conditions.append((f"{column} = ?", (op_or_value,)))
+            else:
+                self.add_condition(column, op_or_value.upper(), value)
+
+        for col, val in conditions.items():
+            self.conditions.append((f"{col} = ?", (val,)))
+        return self
+
+    def where_raw(self, sql: str, params: tuple = ()):
+        self.conditions.append((f"({sql})", tuple(params)))
+        return self
+
+    def where_in(self, column: str, values, negate: bool = False):
+        return self.add_condition(column, "NOT IN" if negate else "IN", values)
+
+    def add_condition(self, column: str, op: str, value):
+
+        if op not in OPERATORS:
+            raise ValueError(f"Unsupported operator '{op}'")
+
+        if op in ("IN", "NOT IN"):
+            # Deduplicated: a value repeated across IN chunks would return its rows once per chunk
+            values = list(dict.fromkeys(value))
+            if not values:
+                # IN () matches nothing, NOT IN () matches everything
+                self.conditions.append(("0" if op == "IN" else "1", ()))
+                return self
+            if len(values) > SQLITE_MAX_VARIABLES // 2 and self.in_values is None:
+                self.in_values = (column, values, op == "NOT IN")
+                return self
+            size = in_bucket(len(values))
+            padded = tuple(values + [values[-1]] * (size - len(values)))
+            self.conditions.append((f"{column} {op} ({', '.join(['?'] * size)})", padded))
+        elif op == "BETWEEN":
+            low, high = value
+            self.conditions.append((f"{column} BETWEEN ? AND ?", (low, high)))
+        else:
+            self.conditions.append((f"{column} {op} ?", (value,)))
+        return self
+
+    def group_by(self, *columns):
+        self.groups.extend(columns)
+        return self
+
+    def having(self, sql: str, params: tuple = ()):
+        self.havings.append((sql, tuple(params)))
+        return self
+
+    def order_by(self, column: str, desc: bool = False):
+        self.orders.append(f"{column} {'DESC' if desc else 'ASC'}")
+        return self
+
+    def limit(self, value: int):
+        self.limit_value = int(value)
+        return self
+
+    def offset(self, value: int):
+        self.offset_value = int(value)
+        return self
+
+    def after(self, columns: Union[str, tuple], values, desc: bool = False):
+
+        """
+        Keyset pagination: rows strictly after `values` in (columns) order.
+        after(("created_at", "id"), (last_created_at, last_id), desc=True)
+        """
+        columns = (columns,) if isinstance(columns, str) else tuple(columns)
+        values = (values,) if len(columns) == 1 and not isinstance(values, (list, tuple)) else tuple(values)
+        op = "<" if desc else ">"
+
+        if values is not None and all(v is not None for v in values):
+            if len(columns) == 1:
+                self.conditions.append((f"{columns[0]} {op} ?", values))
+            else:
+                self.conditions.append((f"({', '.join(columns)}) {op} ({', '.join(['?'] * len(columns))})", values))
+
+        if not self.orders:
+            for col in columns:
+                self.order_by(col, desc)
+        return self
+
+    # ------------- compiling -------------
+    def shape(self, conditions: list) -> tuple:
+
+        return (
+            "query", self.table, tuple(self.columns), self.is_distinct, tuple(self.joins),
+            tuple(sql for sql, _ in conditions), tuple(self.groups), tuple(sql for sql, _ in self.havings),
+            tuple(self.orders), self.limit_value is not None, self.offset_value is not None,
+        )
+
+    def compile(self, conditions: list) -> str:
+
+        query = f"SELECT {'DISTINCT ' if self.is_distinct else ''}{', '.join(self.columns) or '*'} FROM {self.table}"
+        query += "".join(self.joins)
+        if conditions:
+            query += " WHERE " + " AND ".join(sql for sql, _ in conditions)
+        if self.groups:
+            query += " GROUP BY " + ", ".join(self.groups)
+        if self.havings:
+            query += " HAVING " + " AND ".join(sql for sql, _ in self.havings)
+        if self.orders:
+            query += " ORDER BY " + ", ".join(self.orders)
+        if self.limit_value is not None:
+            query += " LIMIT ?"
+        if self.offset_value is not None:
+            if self.limit_value is None:
+                query += " LIMIT -1"
+            query += " OFFSET ?"
+        return query
+
+    def build(self, extra: list = None) -> tuple:
+
+        conditions = self.conditions + (extra or [])
+        query = self.orm.schema.statement(self.shape(conditions), lambda: self.compile(conditions))
+
+        params = [p for _, values in conditions for p in values]
+        params += [p for _, values in self.havings for p in values]
+        if self.limit_value is not None:
+            params.append(self.limit_value)
+        if self.offset_value is not None:
+            params.append(self.offset_value)
+        return query, tuple(params)
+
+    def sql(self) -> tuple:
+
+        """
+        (query, params) as they would be executed (big IN lists excluded).
+        """
+        return self.build()
+
+    # ------------- executing -------------
+    def is_simple(self) -> bool:
+
+        # Results of per-chunk queries can be concatenated as is
+        return not (self.groups or self.havings or self.orders or self.is_distinct
+                    or self.limit_value is not None or self.offset_value is not None
+                    or any(c.upper().startswith(AGGREGATES) for c in self.columns))
+
+    def all(self):
+
+        if self.in_values is None:
+            return self.orm.execute_query(*self.build())
+
+        column, values, negate = self.in_values
+
+        if self.is_simple() and not negate:
+            # Chunk the IN list under SQLite's variable limit and concatenate the results
+            rows = []
+            chunk_size = SQLITE_MAX_VARIABLES // 2
+            for start in range(0, len(values), chunk_size):
+                chunk = values[start : start + chunk_size]
+                size = in_bucket(len(chunk))
+                padded = tuple(chunk + [chunk[-1]] * (size - len(chunk)))
+                result = self.orm.execute_query(*self.build([(f"{column} IN ({', '.join(['?'] * size)})", padded)]))
+                if result is False:
+                    return False
+                rows.extend(result.raw)
+            return QueryResults(rows, formatter=self.orm.format_results)
+
+        # Anything else (ORDER/LIMIT/aggregates/NOT IN): join against a temp table of values
+        with self.orm.transaction() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS orm_in_values (v)")
+            conn.execute("DELETE FROM temp.orm_in_values")
+            conn.executemany("INSERT INTO temp.orm_in_values (v) VALUES (?)", ((v,) for v in values))
+            result = self.orm.execute_query(*self.build([(f"{column} {'NOT IN' if negate else 'IN'} (SELECT v FROM temp.orm_in_values)", ())]))
+            conn.execute("DROP TABLE temp.orm_in_values")
+        return result
+
+    def first(self):
+
+        previous = self.limit_value
+        self.limit_value = 1
+        try:
+            result = self.all()
+        finally:
+            self.limit_value = previous
+        return result[0] if result else None
+
+    def count(self) -> int:
+
+        counter = QueryBuilder(self.orm, self.table)
+        counter.joins, counter.conditions, counter.in_values = self.joins, self.conditions, self.in_values
+        result = counter.aggregate("COUNT", "*", "total").all()
+        if not result:
+            return 0
+        return sum(row[0] for row in result.raw)
+
+    def iter(self, batch_size: int = 1000, as_dict: bool = False):
+
+        if self.in_values is not None:
+            result = self.all()
+            rows = result.raw if result else []
+            return (dict(row) if as_dict else row for row in rows)
+        return self.orm.iter_query(*self.build(), batch_size=batch_size, as_dict=as_dict)
+
+    def page(self, columns: Union[str, tuple], after=None, desc: bool = False, limit: int = 100) -> tuple:
+
+        """
+        (rows, next_cursor) with keyset pagination over `columns`.
+        """
+        columns = (columns,) if isinstance(columns, str) else tuple(columns)
+        if after is not None:
+            self.after(columns, after, desc)
+        elif not self.orders:
+            for col in columns:
+                self.order_by(col, desc)
+        self.limit(limit)
+
+        result = self.all()
+        if not result or result.count < limit:
+            return result, None
+
+        last = result.raw[-1]
+        key = tuple(last[col.split(".")[-1]] for col in columns)
+        return result, key[0] if len(key) == 1 else key
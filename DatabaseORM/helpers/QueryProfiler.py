@@ -0,0 +1,194 @@
+import re
+import threading
+
+from helpers.utils import normalize_sql
+
+# "SCAN users" / "SCAN TABLE users" is a full table scan; "... USING (COVERING) INDEX" is not
+FULL_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+CONDITION_RE = re.compile(r"(?:(\w+)\.)?(\w+)\s*(=|==|IN\b|IS\b|<=|>=|<|>|BETWEEN\b|LIKE\b)", re.IGNORECASE)
+CLAUSE_END_RE = re.compile(r"\b(GROUP\s+BY|ORDER\s+BY|LIMIT|HAVING|UNION|RETURNING)\b", re.IGNORECASE)
+TABLE_RE = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+KEYWORDS = {"AND", "OR", "NOT", "WHERE", "ON", "NULL", "SELECT", "FROM", "CASE", "WHEN", "THEN", "ELSE", "END",
+            "INNER", "LEFT", "CROSS", "JOIN", "GROUP", "ORDER", "LIMIT", "USING", "NATURAL"}
+
+
+class QueryProfiler:
+
+    """
+    Statement hook for SQLiteORM: aggregates latency and row counts per normalized
+    SQL, captures EXPLAIN QUERY PLAN the first time each SELECT shape runs and
+    flags plain full-table SCANs together with an index that would avoid them.
+    """
+
+    def __init__(self, orm, explain: bool = True):
+
+        self.orm = orm
+        self.explain = explain
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, event: dict) -> None:
+
+        if event["type"] != "statement":
+            return
+
+        key = normalize_sql(event["sql"])
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = {
+                    "sql": key,
+                    "calls": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "rows": 0,
+                    "plan": None,
+                    "full_scans": [],
+                    "suggestions": [],
+                }
+            entry["calls"] += 1
+            entry["total_seconds"] += event["seconds"]
+            entry["max_seconds"] = max(entry["max_seconds"], event["seconds"])
+            entry["rows"] += max(event["rows"], 0)
+            needs_plan = self.explain and entry["plan"] is None and event["kind"] == "read" and not event["many"]
+
+        if needs_plan:
+            self.capture_plan(entry, event)
+
+    def capture_plan(self, entry: dict, event: dict) -> None:
+
+        sql = event["sql"].lstrip()
+        if sql.split()[0].upper() not in ("SELECT", "WITH"):
+            entry["plan"] = []
+            return
+
+        try:
+            plan = event["conn"].execute(f"EXPLAIN QUERY PLAN {sql}", event["params"] or ()).fetchall()
+        except Exception:
+            entry["plan"] = []
+            return
+
+        entry["plan"] = [row[3] for row in plan]
+
+        # Recent SQLite versions print the alias ("SCAN t"), map it back to the table
+        aliases = {}
+        for table, alias in TABLE_RE.findall(sql):
+            aliases[table.lower()] = table
+            if alias and alias.upper() not in KEYWORDS:
+                aliases[alias.lower()] = table
+
+        for detail in entry["plan"]:
+            match = FULL_SCAN_RE.match(detail.strip())
+            if not match:
+                continue
+            table = aliases.get(match.group(1).lower(), match.group(1))
+            if table.startswith("sqlite_"):
+                continue
+            entry["full_scans"].append(table)
+            suggestion = self.suggest_index(sql, table, event["conn"])
+            if suggestion:
+                entry["suggestions"].append(suggestion)
+
+    def table_columns(self, table: str, conn) -> list:
+
+        """
+        Column names from the schema cache, or read on the connection that ran the
+        statement: the hook still holds it, so asking the pool for another reader
+        could wait out the whole pool timeout.
+        """
+        info = self.orm.schema.get(table)
+        if info is not None:
+            return info["columns"]
+        try:
+            return [row[1] for row in conn.execute(f"PRAGMA table_info({table});").fetchall()]
+        except Exception:
+            return []
+
+    def suggest_index(self, sql: str, table: str, conn):
+
+        """
+        Equality columns first, then range columns, then ORDER BY columns,
+        restricted to real columns of `table`.
+        """
+        columns = {c.lower(): c for c in self.table_columns(table, conn)}
+        if not columns:
+            return None
+
+        where = re.split(r"\bWHERE\b", sql, maxsplit=1, flags=re.IGNORECASE)
+        equality, ranges = [], []
+        if len(where) == 2:
+            clause = CLAUSE_END_RE.split(where[1], maxsplit=1)[0]
+            for _, col, op in CONDITION_RE.findall(clause):
+                name = columns.get(col.lower())
+                if not name or col.upper() in KEYWORDS:
+                    continue
+                target = equality if op.upper() in ("=", "==", "IN", "IS") else ranges
+                if name not in equality and name not in ranges:
+                    target.append(name)
+
+        order = []
+        order_match = re.search(r"\bORDER\s+BY\s+(.+?)(?:\bLIMIT\b|$)", sql, flags=re.IGNORECASE | re.DOTALL)
+        if order_match:
+            for part in order_match.group(1).split(","):
+                col = part.strip().split()[0].split(".")[-1] if part.strip() else ""
+                name = columns.get(col.lower())
+                if name and name not in equality and name not in ranges and name not in order:
+                    order.append(name)
+
+        index_columns = equality + ranges[:1] + order
+        if not index_columns:
+            return None
+
+        # Explicit (short) select list: append it so the index covers the query
+        select_match = re.match(r"\s*SELECT\s+(?:DISTINCT\s+)?(.+?)\s+FROM\b", sql, flags=re.IGNORECASE | re.DOTALL)
+        if select_match and "*" not in select_match.group(1):
+            selected = [columns.get(part.strip().split()[0].split(".")[-1].lower()) for part in select_match.group(1).split(",") if part.strip()]
+            extra = [name for name in selected if name and name not in index_columns]
+            if None not in selected and len(index_columns) + len(extra) <= 6:
+                index_columns += extra
+
+        name = f"idx_{table}_{'_'.join(index_columns)}"
+        return f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(index_columns)});"
+
+    def report(self, only_full_scans: bool = False) -> list:
+
+        with self.lock:
+            entries = [dict(e) for e in self.entries.values()]
+
+        for entry in entries:
+            entry["avg_seconds"] = entry["total_seconds"] / entry["calls"] if entry["calls"] else 0.0
+            # A full scan reads the whole table on every call
+            entry["est_rows_scanned"] = sum(self.table_rows(t) for t in entry["full_scans"]) * entry["calls"]
+
+        if only_full_scans:
+            entries = [e for e in entries if e["full_scans"]]
+
+        return sorted(entries, key=lambda e: e["total_seconds"], reverse=True)
+
+    def table_rows(self, table: str) -> int:
+
+        # iter_query bypasses the statement hooks, so these lookups are not profiled themselves
+        def scalar(sql, params=None):
+            row = next(self.orm.iter_query(sql, params), None)
+            return row[0] if row is not None else None
+
+        if scalar("SELECT count(*) FROM sqlite_master WHERE name = 'sqlite_stat1'"):
+            estimate = scalar("SELECT stat FROM sqlite_stat1 WHERE tbl = ? AND idx IS NULL", (table,))
+            if estimate:
+                return int(str(estimate).split()[0])
+        return scalar(f"SELECT count(*) FROM {table}") or 0
+
+    def suggestions(self) -> list:
+
+        found = []
+        for entry in self.report(only_full_scans=True):
+            for suggestion in entry["suggestions"]:
+                if suggestion not in found:
+                    found.append(suggestion)
+        return found
+
+    def reset(self) -> None:
+
+        with self.lock:
+            self.entries.clear()
@@ -1,3 +1,15 @@
+from functools import cached_property
+
+
+def decode_value(v):
+
+    if isinstance(v, bytes):
+        try:
+            return v.decode("utf-8")
+        except:
+            return str(v)  # secured fallback
+    return v
+
 
 class QueryResults:
 
@@ -5,33 +17,74 @@ class QueryResults:
         self.rows = rows
         self.formatter = formatter  # in case you want to use format_results
 
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
     @property
     def raw(self):
         return self.rows
 
-    @property
+    @cached_property
+    def keys(self):
+        return list(self.rows[0].keys()) if self.rows else []
+
+    @cached_property
     def dicts(self):
+        """
+        Built once on first access; bytes are only decoded for rows that contain them.
+        """
         if not self.rows:
             return []
 
+        keys = self.keys
         results = []
         for row in self.rows:
-            d = {}
-            for k, v in dict(row).items():
-                if isinstance(v, bytes):
-                    try:
-                        v = v.decode("utf-8")
-                    except:
-                        v = str(v)  # secured fallback
-                d[k] = v
-            results.append(d)
+            values = tuple(row)
+            if any(type(v) is bytes for v in values):
+                values = [decode_value(v) for v in values]
+            results.append(dict(zip(keys, values)))
         return results
 
-
     @property
     def json(self):
+        # Values are scalars, so a shallow copy per row is as safe as a json round-trip
+        return [dict(d) for d in self.dicts]
+
+    @cached_property
+    def json_text(self):
         import json
-        return json.loads(json.dumps(self.dicts, indent=4, ensure_ascii=False))
+        return json.dumps(self.dicts, indent=4, ensure_ascii=False)
+
+    def columns(self) -> dict:
+        """
+        Columnar view straight from the row tuples: { column: [values...] }
+        """
+        if not self.rows:
+            return {}
+        return dict(zip(self.keys, (list(col) for col in zip(*self.rows))))
+
+    def to_numpy(self, columns: list = None) -> dict:
+        """
+        { column: np.ndarray }, numeric columns get a numeric dtype.
+        """
+        import numpy as np
+
+        data = self.columns()
+        names = columns or list(data.keys())
+        return {name: np.asarray(data[name]) for name in names}
+
+    def to_pandas(self):
+        import pandas as pd
+
+        if not self.rows:
+            return pd.DataFrame()
+        return pd.DataFrame.from_records([tuple(row) for row in self.rows], columns=self.keys)
 
     @property
     def table(self):
@@ -42,7 +95,7 @@ class QueryResults:
         if not self.rows:
             return "No results."
 
-        headers = self.rows[0].keys()
+        headers = self.keys
         out = " | ".join(headers) + "\n"
         out += "-" * len(out) + "\n"
 
@@ -57,8 +110,8 @@ class QueryResults:
 
     @property
     def scalar(self):
-        return list(self.rows[0].values())[0] if self.rows else None
+        return self.rows[0][0] if self.rows else None
 
     @property
     def count(self):
-        return len(self.rows)
\ No newline at end of file
+        return len(self.rows)
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from collections import deque
+
+from helpers.utils import normalize_sql
+
+logger = logging.getLogger("SQLiteORM")
+
+
+def percentile(values: list, p: float) -> float:
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(p / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class QueryStats:
+
+    """
+    Statement/commit hook for SQLiteORM: counters and latency percentiles per
+    normalized SQL (last `sample_size` calls of each shape), commit latency and
+    a slow-query log through logging.getLogger("SQLiteORM").
+    """
+
+    def __init__(self, slow_query_ms: float = 200.0, sample_size: int = 1024):
+
+        self.slow_query_ms = slow_query_ms
+        self.sample_size = sample_size
+        self.statements = {}
+        self.commits = deque(maxlen=sample_size)
+        self.commit_count = 0
+        self.errors = 0
+        self.slow_queries = 0
+        self.started = time.time()
+        self.lock = threading.Lock()
+
+    def __call__(self, event: dict) -> None:
+
+        if event["type"] == "commit":
+            with self.lock:
+                self.commit_count += 1
+                self.commits.append(event["seconds"])
+            return
+
+        if event["type"] == "error":
+            with self.lock:
+                self.errors += 1
+            return
+
+        if event["type"] != "statement":
+            return
+
+        key = normalize_sql(event["sql"])
+        ms = event["seconds"] * 1000
+
+        with self.lock:
+            entry = self.statements.get(key)
+            if entry is None:
+                entry = self.statements[key] = {
+                    "calls": 0,
+                    "rows": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "kind": event["kind"],
+                    "samples": deque(maxlen=self.sample_size),
+                }
+            entry["calls"] += 1
+            entry["rows"] += max(event["rows"], 0)
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            entry["samples"].append(ms)
+
+            slow = self.slow_query_ms is not None and ms >= self.slow_query_ms
+            if slow:
+                self.slow_queries += 1
+
+        if slow:
+            logger.warning("Slow query (%.1f ms, %s rows): %s", ms, event["rows"], key)
+
+    def snapshot(self, top: int = None) -> dict:
+
+        """
+        JSON-serializable view, statements sorted by total time.
+        """
+        with self.lock:
+            statements = [
+                {
+                    "sql": key,
+                    "kind": e["kind"],
+                    "calls": e["calls"],
+                    "rows": e["rows"],
+                    "total_ms": round(e["total_ms"], 3),
+                    "avg_ms": round(e["total_ms"] / e["calls"], 3),
+                    "p50_ms": round(percentile(list(e["samples"]), 50), 3),
+                    "p95_ms": round(percentile(list(e["samples"]), 95), 3),
+                    "p99_ms": round(percentile(list(e["samples"]), 99), 3),
+                    "max_ms": round(e["max_ms"], 3),
+                }
+                for key, e in self.statements.items()
+            ]
+            commits = [s * 1000 for s in self.commits]
+            summary = {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "statements_total": sum(s["calls"] for s in statements),
+                "errors": self.errors,
+                "slow_queries": self.slow_queries,
+                "slow_query_ms": self.slow_query_ms,
+                "commits": {
+                    "count": self.commit_count,
+                    "p50_ms": round(percentile(commits, 50), 3),
+                    "p95_ms": round(percentile(commits, 95), 3),
+                    "p99_ms": round(percentile(commits, 99), 3),
+                    "max_ms": round(max(commits), 3) if commits else 0.0,
+                },
+            }
+
+        statements.sort(key=lambda s: s["total_ms"], reverse=True)
+        summary["statements"] = statements[:top] if top else statements
+        return summary
+
+    def reset(self) -> None:
+
+        with self.lock:
+            self.statements.clear()
+            self.commits.clear()
+            self.commit_count = 0
+            self.errors = 0
+            self.slow_queries = 0
+            self.started = time.time()
@@ -0,0 +1,132 @@
+import keyword
+import operator
+import re
+import threading
+
+# Names a column must not shadow (MappedRow methods)
+RESERVED = {"keys", "get"}
+
+
+def slot_names(fields: tuple) -> tuple:
+
+    """
+    Valid, unique attribute names for the columns: "count(*)" -> "count___", "class" -> "class_".
+    """
+    names = []
+    for field in fields:
+        name = re.sub(r"\W", "_", field) or "col"
+        if name[0].isdigit() or name[0] == "_":
+            name = f"c{name}" if name[0] == "_" else f"c_{name}"
+        while keyword.iskeyword(name) or name in RESERVED or name in names:
+            name += "_"
+        names.append(name)
+    return tuple(names)
+
+
+class MappedRow(tuple):
+
+    """
+    Base of the generated row classes: a tuple subclass without __dict__, so
+    building one is a single C-level tuple copy. Behaves like sqlite3.Row
+    (row[0], row["name"], keys(), dict(row)) and adds attribute access (row.name).
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _index = {}
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            index = self._index.get(key)
+            if index is None:
+                index = self._index.get(key.lower())
+                if index is None:
+                    raise IndexError(f"No item with that key: {key}")
+            key = index
+        return tuple.__getitem__(self, key)
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={value!r}" for field, value in zip(self._fields, self))
+        return f"{type(self).__name__}({values})"
+
+    def keys(self) -> list:
+        return list(self._fields)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except IndexError:
+            return default
+
+    def _asdict(self) -> dict:
+        return dict(zip(self._fields, self))
+
+
+def make_row_class(name: str, fields: tuple) -> type:
+
+    fields = tuple(fields)
+
+    index = {field: i for i, field in enumerate(fields)}
+    for i, field in enumerate(fields):
+        index.setdefault(field.lower(), i)
+
+    namespace = {"__slots__": (), "_fields": fields, "_index": index}
+    for i, attribute in enumerate(slot_names(fields)):
+        namespace[attribute] = property(operator.itemgetter(i), doc=f"Column {fields[i]!r}")
+
+    return type(re.sub(r"\W", "_", name) or "Row", (MappedRow,), namespace)
+
+
+class RowFactory:
+
+    """
+    Builds MappedRow instances, in bulk (map_rows) or as a sqlite3 row_factory:
+    one generated class per column layout (per table when registered through
+    SQLiteORM.row_class), so a row costs one small tuple instead of a sqlite3.Row plus a dict.
+    """
+
+    def __init__(self):
+
+        self.classes = {} # column names -> class
+        self.lock = threading.Lock()
+        self.last = (None, None) # (cursor.description, class) of the last statement
+
+    def register(self, name: str, fields) -> type:
+
+        fields = tuple(fields)
+        with self.lock:
+            cls = self.classes.get(fields)
+            if cls is None or cls.__name__ == "Row":
+                cls = self.classes[fields] = make_row_class(name, fields)
+        return cls
+
+    def class_for(self, description) -> type:
+
+        fields = tuple(column[0] for column in description)
+        cls = self.classes.get(fields)
+        if cls is None:
+            cls = self.register("Row", fields)
+        return cls
+
+    def map_rows(self, cursor, rows: list) -> list:
+
+        """
+        Bulk path for rows fetched as plain tuples (row_factory = None):
+        map(cls, rows) builds every row in C, no Python call per row.
+        """
+        if not rows:
+            return rows
+        return list(map(self.class_for(cursor.description), rows))
+
+    def __call__(self, cursor, row):
+
+        """
+        Usable as conn.row_factory on any connection (one Python call per row).
+        """
+        # description is the same tuple for every row of a statement, skip the lookup
+        description = cursor.description
+        last_description, cls = self.last
+        if description is not last_description:
+            cls = self.class_for(description)
+            self.last = (description, cls)
+        return cls(row)
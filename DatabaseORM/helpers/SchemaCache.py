@@ -0,0 +1,71 @@
+import threading
+import time
+
+
+class SchemaCache:
+
+    """
+    Cache of PRAGMA table_info results and prebuilt SQL strings, keyed by table.
+    Everything is dropped when the database reports a new PRAGMA schema_version
+    or when the ORM runs a DDL statement itself.
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+
+        self.check_interval = check_interval
+        self.schema_version = None
+        self.last_check = 0.0
+        self.tables = {}
+        self.statements = {}
+        self.lock = threading.Lock()
+
+    def needs_check(self) -> bool:
+
+        return (time.monotonic() - self.last_check) >= self.check_interval
+
+    def check_version(self, version: int) -> None:
+
+        with self.lock:
+            self.last_check = time.monotonic()
+            if version != self.schema_version:
+                self.tables.clear()
+                self.statements.clear()
+                self.schema_version = version
+
+    def get(self, table_name: str):
+
+        return self.tables.get(table_name)
+
+    def set(self, table_name: str, info: list) -> dict:
+
+        entry = {
+            "info": info,
+            "columns": [col["name"] for col in info],
+            "pk": [col["name"] for col in info if col["pk"] > 0],
+            "types": {col["name"]: (col["type"] or "").upper() for col in info},
+        }
+        with self.lock:
+            self.tables[table_name] = entry
+        return entry
+
+    def statement(self, key: tuple, builder) -> str:
+
+        query = self.statements.get(key)
+        if query is None:
+            query = builder()
+            with self.lock:
+                self.statements[key] = query
+        return query
+
+    def invalidate(self, table_name: str = None) -> None:
+
+        with self.lock:
+            if table_name is None:
+                self.tables.clear()
+                self.statements.clear()
+                self.schema_version = None
+                return
+
+            self.tables.pop(table_name, None)
+            for key in [k for k in self.statements if table_name in k]:
+                del self.statements[key]
@@ -1,5 +1,9 @@
 import sys
 import os
+import sqlite3
+
+# Max "?" per statement (SQLITE_MAX_VARIABLE_NUMBER default, 999 before SQLite 3.32)
+SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
 
 def auto_chunk_size(data, mode="balanced"):
     """
@@ -13,8 +17,12 @@ def auto_chunk_size(data, mode="balanced"):
     if n == 0:
         return 1
 
-    # tamaño promedio
-    avg_size = sys.getsizeof(data[0])
+    # tamaño promedio (contenedor + valores, no solo la cabecera de la tupla)
+    sample = data[:100]
+    avg_size = sum(
+        sys.getsizeof(row) + (sum(sys.getsizeof(v) for v in row) if isinstance(row, (list, tuple)) else 0)
+        for row in sample
+    ) // len(sample)
 
     # 1) heurística general por tamaño
     if avg_size < 64:
@@ -44,3 +52,81 @@ def auto_chunk_size(data, mode="balanced"):
         return min(1000, base)
     else:
         return base
+
+
+def iter_rows(items):
+    """
+    Flatten any row source into row tuples/lists:
+    lists, generators, csv.reader, or an iterator of pandas DataFrames (read_csv(chunksize=...)).
+    """
+    if hasattr(items, "itertuples"):
+        yield from items.itertuples(index=False, name=None)
+        return
+
+    for item in items:
+        if hasattr(item, "itertuples"):
+            yield from item.itertuples(index=False, name=None)
+        else:
+            yield item
+
+
+def normalize_sql(query: str) -> str:
+    """
+    Shape of a statement, used to group stats:
+    literals -> ?, IN (?, ?, ...) -> IN (?...), whitespace collapsed.
+    """
+    import re
+
+    text = re.sub(r"'(?:[^']|'')*'", "?", query)
+    text = re.sub(r"\b\d+(?:\.\d+)?\b", "?", text)
+    text = re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)", "(?...)", text)
+    return re.sub(r"\s+", " ", text).strip().rstrip(";")
+
+
+def statement_kind(query: str) -> str:
+    """
+    First keyword of the statement that actually runs: for a WITH query, the one after
+    the common table expressions ("WITH x AS (SELECT ...) INSERT ..." -> "INSERT").
+    """
+    import re
+
+    # Strings, quoted names and comments can't hide a keyword
+    text = re.sub(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/", " ", query, flags=re.DOTALL)
+    words = text.split()
+    if not words:
+        return ""
+    first = words[0].upper()
+    if first != "WITH":
+        return first
+
+    depth = 0
+    for token in re.findall(r"\(|\)|\w+", text):
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif depth == 0 and token.upper() in ("SELECT", "VALUES", "INSERT", "REPLACE", "UPDATE", "DELETE"):
+            return token.upper()
+    return first
+
+
+def available_memory():
+    """
+    Bytes of RAM currently available to the process (None if it cannot be read).
+    """
+    # MemAvailable counts reclaimable page cache; SC_AVPHYS_PAGES is free pages only,
+    # which is a small fraction of the usable RAM on a host that has been up for a while
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        pass
+
+    return None
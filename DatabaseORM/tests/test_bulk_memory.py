@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+from conftest import ROOT
+
+# Loads `rows` rows of ~1 KB through insert_many (one transaction, "bulk" profile)
+# in a fresh interpreter and prints its peak RSS in KB
+LOAD = """
+import resource, sys
+from SQLiteORM import SQLiteORM
+
+db = SQLiteORM(sys.argv[1])
+db.connect_DB()
+db.cursor.execute("CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, payload TEXT)")
+db.conn.commit()
+rows = ((f"item{i}", "x" * 1000) for i in range(int(sys.argv[2])))
+assert db.insert_many("items", rows) is not False
+db.close_connection()
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def peak_rss_kb(path, rows):
+
+    result = subprocess.run(
+        [sys.executable, "-c", LOAD, path, str(rows)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return int(result.stdout.strip().splitlines()[-1])
+
+
+def test_insert_many_memory_stays_flat(tmp_path):
+
+    # 80 MB vs 240 MB of data, both past the bulk cache_size
+    small = peak_rss_kb(str(tmp_path / "small.db"), 80_000)
+    large = peak_rss_kb(str(tmp_path / "large.db"), 240_000)
+
+    # An unbounded non-spilling cache would grow by ~160 MB here
+    assert large - small < 40 * 1024, f"peak RSS grew from {small} KB to {large} KB"
@@ -0,0 +1,18 @@
+from SQLiteORM import SQLiteORM
+
+
+def test_delete_ids_reports_rows_deleted(tmp_path):
+
+    db = SQLiteORM(str(tmp_path / "delete.db"))
+    db.connect_DB()
+    db.cursor.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    db.cursor.executemany("INSERT INTO items (id, name) VALUES (?, ?)", ((i, f"item{i}") for i in range(1, 11)))
+    db.conn.commit()
+
+    calls = []
+    # 5 of the 10 ids exist
+    deleted = db.delete_ids("items", "id", [1, 2, 3, 100, 101, 4, 5, 102, 103, 104], batch_size=5, progress=lambda done, total: calls.append((done, total)))
+
+    assert deleted == 5
+    assert calls == [(3, 10), (5, 10)]
+    db.close_connection()
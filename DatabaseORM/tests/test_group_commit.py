@@ -0,0 +1,97 @@
+import sqlite3 as sql
+from contextlib import contextmanager
+
+import pytest
+
+from SQLiteORM import SQLiteORM
+
+
+def test_failed_begin_fails_every_future(tmp_path, monkeypatch):
+
+    db = SQLiteORM(str(tmp_path / "group.db"))
+    db.connect_DB()
+    db.cursor.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    db.conn.commit()
+
+    @contextmanager
+    def locked():
+        raise sql.OperationalError("database is locked")
+        yield
+
+    monkeypatch.setattr(db, "transaction", locked)
+    writer = db.start_group_commit(max_rows=10, max_delay_ms=20)
+    futures = [writer.submit("INSERT INTO items (name) VALUES (?)", (f"item{i}",)) for i in range(5)]
+
+    for future in futures:
+        with pytest.raises(sql.OperationalError, match="locked"):
+            future.result(timeout=5)
+
+    monkeypatch.undo()
+    db.close_connection()
+
+
+class ReleaseFailsOnce:
+
+    """
+    Minimal ORM for the writer: real outer transaction, the first SAVEPOINT release fails.
+    """
+
+    def __init__(self, path):
+        self.conn = sql.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        self.depth = 0
+        self.failed = False
+
+    @contextmanager
+    def transaction(self):
+        self.depth += 1
+        try:
+            if self.depth == 1:
+                self.conn.execute("BEGIN")
+                yield self.conn
+                self.conn.execute("COMMIT")
+            else:
+                yield self.conn
+                if not self.failed:
+                    self.failed = True
+                    raise sql.OperationalError("release failed")
+        except BaseException:
+            if self.depth == 1 and self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            raise
+        finally:
+            self.depth -= 1
+
+
+def test_failed_release_fails_only_its_future(tmp_path):
+
+    from helpers.GroupCommitWriter import GroupCommitWriter
+
+    writer = GroupCommitWriter(ReleaseFailsOnce(str(tmp_path / "release.db")), max_rows=10, max_delay_ms=20)
+    futures = [writer.submit("INSERT INTO items (name) VALUES (?)", (f"item{i}",)) for i in range(3)]
+
+    with pytest.raises(sql.OperationalError, match="release failed"):
+        futures[0].result(timeout=5)
+    assert [f.result(timeout=5)["rowcount"] for f in futures[1:]] == [1, 1]
+
+    # The writer thread is still alive
+    assert writer.submit("INSERT INTO items (name) VALUES ('later')").result(timeout=5)["rowcount"] == 1
+    writer.stop()
+
+
+def test_async_enqueue_without_pool(tmp_path):
+
+    import asyncio
+    from AsyncSQLiteORM import AsyncSQLiteORM
+
+    async def main():
+        async with AsyncSQLiteORM(str(tmp_path / "async.db")) as db:
+            await db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+            writes = []
+            for i in range(50):
+                writes.append(db.execute("INSERT INTO items (name) VALUES (?)", (f"direct{i}",)))
+                writes.append(db.enqueue("INSERT INTO items (name) VALUES (?)", (f"queued{i}",)))
+            await asyncio.wait_for(asyncio.gather(*writes), timeout=10)
+            return await db.execute("SELECT count(*) FROM items")
+
+    assert asyncio.run(main()).raw[0][0] == 100
@@ -0,0 +1,23 @@
+import random
+
+from SQLiteORM import SQLiteORM
+
+
+def test_multi_values_statement_cache_stays_bounded(tmp_path):
+
+    db = SQLiteORM(str(tmp_path / "values.db"))
+    db.connect_DB()
+    db.cursor.execute("CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, qty INTEGER)")
+    db.conn.commit()
+
+    generator = random.Random(7)
+    total = 0
+    for _ in range(30):
+        n = generator.randint(1, 5000)
+        total += n
+        assert db.insert_many("items", [(f"item{i}", i) for i in range(n)], multi_values=True) is not False
+
+    assert db.execute_query("SELECT count(*) FROM items").raw[0][0] == total
+    shapes = [key for key in db.schema.statements if key[0] == "insert_values"]
+    assert len(shapes) <= 16, len(shapes)
+    db.close_connection()
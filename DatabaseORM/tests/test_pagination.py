@@ -0,0 +1,22 @@
+from SQLiteORM import SQLiteORM
+
+
+def test_select_page_without_the_key_column(tmp_path):
+
+    db = SQLiteORM(str(tmp_path / "pages.db"))
+    db.connect_DB()
+    db.cursor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    db.cursor.executemany("INSERT INTO t (name) VALUES (?)", ((f"n{i}",) for i in range(7)))
+    db.conn.commit()
+
+    names, after = [], None
+    while True:
+        rows, after = db.select_page("t", after=after, columns=["name"], limit=3)
+        names += [row["name"] for row in rows.raw]
+        if after is None:
+            break
+
+    assert names == [f"n{i}" for i in range(7)]
+    rows, after = db.select_page("t", columns="name", limit=3)
+    assert after == 3
+    db.close_connection()
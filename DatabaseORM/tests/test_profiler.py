@@ -0,0 +1,25 @@
+import time
+
+from SQLiteORM import SQLiteORM
+
+
+def test_profiler_does_not_take_a_second_reader(tmp_path):
+
+    path = str(tmp_path / "profiled.db")
+    setup = SQLiteORM(path)
+    setup.connect_DB()
+    setup.cursor.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT, name TEXT)")
+    setup.cursor.executemany("INSERT INTO users (email, name) VALUES (?, ?)", ((f"u{i}@x", f"u{i}") for i in range(100)))
+    setup.conn.commit()
+    setup.close_connection()
+
+    db = SQLiteORM(path)
+    db.connect_pool(size=1, timeout=3)
+    db.enable_profiler()
+
+    started = time.perf_counter()
+    assert db.execute_query("SELECT * FROM users WHERE email = ?", ("u5@x",))
+    assert time.perf_counter() - started < 1
+
+    assert db.index_suggestions() == ["CREATE INDEX IF NOT EXISTS idx_users_email ON users (email);"]
+    db.close_connection()
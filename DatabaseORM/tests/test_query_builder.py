@@ -0,0 +1,35 @@
+from SQLiteORM import SQLiteORM
+
+
+def test_where_in_duplicate_across_chunks(tmp_path):
+
+    db = SQLiteORM(str(tmp_path / "in.db"))
+    db.connect_DB()
+    db.cursor.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    db.cursor.executemany("INSERT INTO items (id, name) VALUES (?, ?)", ((i, f"item{i}") for i in range(1, 20000)))
+    db.conn.commit()
+
+    # 1 is in the first chunk and again at the end of the list, in the last one
+    ids = list(range(1, 20000)) + [1]
+    rows = db.table("items").where_in("id", ids).all()
+
+    assert len(rows) == 19999
+    assert sorted(row[0] for row in rows.raw) == list(range(1, 20000))
+    db.close_connection()
+
+
+def test_select_helpers_with_reserved_column_names(tmp_path):
+
+    db = SQLiteORM(str(tmp_path / "settings.db"))
+    db.connect_DB()
+    db.cursor.execute("CREATE TABLE settings (id INTEGER PRIMARY KEY, key TEXT, value TEXT, column TEXT)")
+    db.cursor.executemany("INSERT INTO settings (key, value, column) VALUES (?, ?, ?)",
+                          [("a", "x", "c1"), ("in", "y", "c2"), ("c", "z", "c3")])
+    db.conn.commit()
+
+    assert [row["id"] for row in db.select_where("settings", value="y").raw] == [2]
+    assert db.select_one("settings", value="z")["id"] == 3
+    assert [row["id"] for row in db.select_where("settings", column="c2").raw] == [2]
+    assert db.select_by_id("settings", "key", "in")["id"] == 2
+    assert [row["id"] for row in db.table("settings").where(value="x", column="c1").all().raw] == [1]
+    db.close_connection()
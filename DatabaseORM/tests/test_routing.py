@@ -0,0 +1,55 @@
+import pytest
+
+from SQLiteORM import SQLiteORM
+
+
+@pytest.mark.parametrize("query, read", [
+    ("SELECT * FROM items", True),
+    ("PRAGMA table_info(items);", True),
+    ("PRAGMA main.index_list(items)", True),
+    ("PRAGMA user_version", True),
+    ("PRAGMA user_version = 3", False),
+    ("PRAGMA optimize;", False),
+    ("PRAGMA wal_checkpoint(PASSIVE);", False),
+    ("PRAGMA incremental_vacuum(100)", False),
+    ("PRAGMA cache_size", False),
+    ("INSERT INTO items VALUES (1)", False),
+])
+def test_is_read_query(query, read):
+
+    assert SQLiteORM(":memory:").is_read_query(query) is read
+
+
+@pytest.mark.parametrize("query, read", [
+    ("WITH x AS (SELECT 1 AS n) SELECT * FROM x", True),
+    ("WITH x AS (SELECT 1 AS n) INSERT INTO items SELECT n FROM x", False),
+    ("WITH RECURSIVE c(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM c WHERE n < 3) DELETE FROM items WHERE id IN c", False),
+    ("EXPLAIN QUERY PLAN SELECT * FROM items", True),
+])
+def test_cte_is_classified_by_its_statement(query, read):
+
+    assert SQLiteORM(":memory:").is_read_query(query) is read
+
+
+def test_pool_mode_cte_write_fetch_and_reset(tmp_path):
+
+    path = str(tmp_path / "pool.db")
+    setup = SQLiteORM(path)
+    setup.connect_DB()
+    setup.cursor.execute("CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, n INTEGER)")
+    setup.conn.commit()
+    setup.close_connection()
+
+    db = SQLiteORM(path)
+    db.connect_pool(size=2, timeout=3)
+    assert db.execute_query("WITH RECURSIVE c(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM c WHERE n < 5) INSERT INTO items (n) SELECT n FROM c")
+
+    assert db.execute_query("SELECT n FROM items ORDER BY n")
+    assert db.fetch_one() == {"n": 1}
+    assert db.fetch_many(2) == [{"n": 2}, {"n": 3}]
+    assert db.fetch_all() == [{"n": 4}, {"n": 5}]
+
+    assert db.reset_autoincrement("items")
+    assert db.reset_autoincrements()
+    assert db.execute_query("SELECT count(*) FROM sqlite_sequence").raw[0][0] == 0
+    db.close_connection()
@@ -0,0 +1,36 @@
+from ShardedSQLiteORM import ShardedSQLiteORM, shard_paths
+
+
+def make_shards(tmp_path, n=3):
+
+    db = ShardedSQLiteORM(shard_paths(str(tmp_path / "tasks.db"), n), shard_key="id_user")
+    db.connect()
+    db.execute_all("CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, id_user INTEGER, title TEXT, priority INTEGER)")
+    return db
+
+
+def test_insert_many_streams_a_generator(tmp_path):
+
+    db = make_shards(tmp_path)
+    rows = ((i % 7, f"task{i}", i) for i in range(25_000))
+
+    assert db.insert_many("tasks", rows)
+    assert db.count("tasks") == 25_000
+    for index, shard in enumerate(db.shards):
+        result = shard.execute_query("SELECT DISTINCT id_user FROM tasks")
+        assert all(db.shard_index(row[0]) == index for row in result.raw)
+    db.close()
+
+
+def test_fan_out_orders_nulls_like_sqlite(tmp_path):
+
+    db = make_shards(tmp_path)
+    for id_user, priority in [(0, 3), (1, None), (2, 1), (3, None), (4, 2), (5, 5)]:
+        db.execute("INSERT INTO tasks (id_user, title, priority) VALUES (?, ?, ?)", (id_user, "t", priority), key=id_user)
+
+    asc = db.fan_out("SELECT * FROM tasks ORDER BY priority", order_by="priority")
+    desc = db.fan_out("SELECT * FROM tasks ORDER BY priority DESC", order_by="priority", desc=True)
+
+    assert [row["priority"] for row in asc.raw] == [None, None, 1, 2, 3, 5]
+    assert [row["priority"] for row in desc.raw] == [5, 3, 2, 1, None, None]
+    db.close()
@@ -0,0 +1,43 @@
+import sqlite3 as sql
+
+import pytest
+
+from SQLiteORM import SQLiteORM
+
+
+@pytest.fixture
+def db(tmp_path):
+
+    db = SQLiteORM(str(tmp_path / "tx.db"))
+    db.connect_DB()
+    db.cursor.executescript("""
+        PRAGMA foreign_keys = ON;
+        CREATE TABLE users (id INTEGER PRIMARY KEY);
+        CREATE TABLE tasks (id INTEGER PRIMARY KEY, id_user INTEGER REFERENCES users(id) DEFERRABLE INITIALLY DEFERRED);
+    """)
+    yield db
+    db.close_connection()
+
+
+def test_failed_commit_rolls_back(db):
+
+    with pytest.raises(sql.IntegrityError):
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO tasks (id_user) VALUES (42)")
+
+    assert not db.conn.in_transaction
+
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO users (id) VALUES (1)")
+    assert db.conn.execute("SELECT count(*) FROM tasks").fetchone()[0] == 0
+
+
+def test_foreign_open_transaction_is_not_committed(db):
+
+    db.conn.execute("INSERT INTO users (id) VALUES (7)") # implicit BEGIN, never committed
+    with pytest.raises(sql.OperationalError):
+        with db.transaction():
+            pass
+
+    db.conn.rollback()
+    assert db.conn.execute("SELECT count(*) FROM users").fetchone()[0] == 0
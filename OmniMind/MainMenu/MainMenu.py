@@ -3,7 +3,7 @@ import flet as ft
 import json
 import asyncio
 from params import ICONS, REQUEST_URL, HEADERS
-from helpers.utils import addElementsPage, getSession, handle_logout, log_error, get_time_ago, convert_seconds
+from helpers.utils import addElementsPage, getSession, handle_logout, log_error, get_time_ago, convert_seconds, cached_get
 from footer_navegation.navegation import footer_navbar
 from middlewares.auth import middleware_auth
 import requests_async as request
@@ -31,8 +31,7 @@ async def render_games(page: ft.Page):
 
     async def load_games():
 
-        response = await request.get( f"{REQUEST_URL}/games/scores" , headers=headers  )
-        return response.json()
+        return await cached_get( f"{REQUEST_URL}/games/scores" , headers=headers  )
 
     game_data = asyncio.create_task( load_games() )
 
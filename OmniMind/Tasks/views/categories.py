@@ -1,9 +1,8 @@
 import json
 import asyncio
-import requests_async as request
 import flet as ft
 from params import *
-from helpers.utils import log_error, loadSnackbar, setCarrousel
+from helpers.utils import log_error, loadSnackbar, setCarrousel, cached_get
 
 def loadTasksCategories(page: ft.Page, token, viewDetailsCategory, addTask, addCategory, callbacks={}):
     """Carga las categorías de tareas desde la API."""
@@ -13,28 +12,17 @@ def loadTasksCategories(page: ft.Page, token, viewDetailsCategory, addTask, addC
             headers = HEADERS
             headers["Authorization"] = f"Bearer {token}"
 
-            response = await request.get(
+            # 304 while the categories are unchanged: the last response is reused
+            data = await cached_get(
                 f"{REQUEST_URL}/tasks/categories",
                 headers=headers,
                 timeout=10
             )
 
-            if response.status_code != 200:
-                print(f"⚠️ HTTP Error: {response.status_code}")
-                try:
-                    print("Response:", response.json())
-                except Exception:
-                    print("Response not JSON decodable.")
-                return None
-
-            try:
-                data = response.json()
-                if not isinstance(data, dict):
-                    raise ValueError("Response JSON is not a dictionary.")
-                return data
-            except Exception as e:
-                log_error("load_data.json", e)
+            if not isinstance(data, dict):
+                log_error("load_data.json", ValueError("Response JSON is not a dictionary."))
                 return None
+            return data
 
         except (asyncio.TimeoutError, OSError, ConnectionError):
             loadSnackbar(page, "⚠️ Connection error or timeout while loading categories.", "red")
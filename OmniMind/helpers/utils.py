@@ -5,6 +5,7 @@ from jwt import InvalidTokenError
 import math
 from datetime import datetime, timezone, timedelta
 import platform
+import requests_async
 from components.PopupMenu import PopupMenuButton # TODO for testing
 # from flet_popupmenu import PopupMenuButton # TODO for production
 from params import HEADERS, REQUEST_URL
@@ -435,8 +436,34 @@ def setInputField( type_ , label = "" , placeholder = "" , bg_color = "#F5F5F5"
 def handle_logout(page: ft.Page):
     page.session.clear()
     page.client_storage.clear()
+    http_cache.clear()
     page.go("/")
 
+# (url, Authorization) -> (ETag, JSON) of the last successful GET
+http_cache = {}
+
+async def cached_get(url, headers, **kwargs):
+    """
+    GET revalidated with If-None-Match: while the data is unchanged the server
+    answers 304 without a body and the JSON received last time is returned.
+    """
+    key = (url, headers.get("Authorization"))
+    cached = http_cache.get(key)
+
+    headers = dict(headers)
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    response = await requests_async.get(url, headers=headers, **kwargs)
+    if response.status_code == 304 and cached:
+        return cached[1]
+
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if response.status_code == 200 and etag:
+        http_cache[key] = (etag, data)
+    return data
+
 
 def getSession( data , decrypt=False ):
 
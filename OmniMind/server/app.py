@@ -11,6 +11,9 @@ import os
 
 from dotenv import load_dotenv
 from helpers.utils import get_queries
+from helpers.auth import get_token, verify_token, token_cache, SECRET_KEY, ALGORITHM
+from helpers.pagination import page_size, decode_cursor, paginate
+from helpers.response_cache import response_cache
 from conf.conn import init_connection, init_tables
 
 import datetime
@@ -23,53 +26,62 @@ user_admin = os.getenv("ADMIN_USER")
 email_admin = os.getenv("ADMIN_EMAIL")
 password_admin = os.getenv("PASSWORD_USER")
 
-db = Database()
-
 app = Flask(__name__)
 
 def handle_server():
 
-    if init_connection( db ) == False: raise Exception("🤔 Something went wrong in the server!!")
+    # Startup only (tables, seed data); requests use get_db()
+    database = Database()
+    if init_connection( database ) == False: raise Exception("🤔 Something went wrong in the server!!")
+    return database
+
+def get_db():
+
+    # One pooled connection + cursor per request, nothing shared between threads
+    return Database.get_db(g)
+
+@app.teardown_appcontext
+def release_db(exception):
+
+    Database.release_db(g)
 
-def parse_json_response( message , status = 200 ):
+def parse_json_response( message , status = 200, **extra ):
 
     return jsonify(
             message=message,
-            status=status
+            status=status,
+            **extra
         )
     
-def check_authorization(headers):
-    
-    try:
-    
-        auth_header = headers.get("Authorization", None)
-        if not auth_header:
-            return False
-
-        if "Bearer" not in auth_header:
-            return False
-        
-        # Obtain token
-        token = auth_header.split(" ")[1]
-        if not token:
-            return False
+def get_user_id(headers):
 
-        # Validate token
-        db.execute_query(
-            """
-                SELECT * from users where token = ?
-            """,
-            (token,)
-        )
+    # Authenticated user id from the Bearer token (cached), None if missing or invalid
+    return verify_token( get_token(headers), get_db )
 
-        result = db.fetch_all()
-        if not result:
-            return False
+def check_authorization(headers):
 
-        return True
-    
-    except IndexError:
-        return False
+    return get_user_id(headers) is not None
+
+def cached_response(id_user, scope, build):
+
+    """
+    GET served from the per-user response cache: build() runs (queries + JSON) on a miss only.
+    Sends ETag and Last-Modified; a matching If-None-Match / If-Modified-Since gets an empty 304.
+    """
+    url = request.full_path
+    entry = response_cache.get(id_user, scope, url)
+    if entry is None:
+        # Taken before reading: a write committed meanwhile keeps this body out of the cache
+        generation = response_cache.generation(id_user)
+        entry = response_cache.set(id_user, scope, url, build().get_data(), generation)
+
+    response = app.response_class(entry.body, mimetype="application/json")
+    response.set_etag(entry.etag)
+    response.headers["Last-Modified"] = entry.last_modified
+    # The client may keep it, but has to revalidate every time
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 # Define routes outside of __main__ block
 @app.route("/roles", methods=["GET"])
@@ -77,7 +89,7 @@ def get_roles():
 
     try:
 
-        handle_server()
+        db = get_db()
         
         # Check autorization header
         try:
@@ -105,7 +117,7 @@ def get_users():
 
     try:
 
-        handle_server()
+        db = get_db()
         
         # Check autorization header
         try:
@@ -134,7 +146,7 @@ def register():
 
     try:
 
-        handle_server()
+        db = get_db()
 
         json_data = request.json
 
@@ -170,8 +182,6 @@ def register():
             ( username , email, password , 2 , None )
         )
 
-        time.sleep(0.2)
-
         db.execute_query(
             """ 
                 SELECT * from users where username = ? and email = ?
@@ -199,8 +209,6 @@ def register():
 
         logging.debug(db.get_query())
 
-        db.close_connection()
-
         return parse_json_response("User registered successfully", 200)
 
     except Exception as e:
@@ -214,7 +222,7 @@ def update():
 
     try:
 
-        handle_server()
+        db = get_db()
 
         json_data = request.json
 
@@ -253,9 +261,11 @@ def update():
             ( username , email,  password )
         )
 
-        logging.debug(db.get_query())
+        token_cache.invalidate_user( result[0]["id"] )
+        # username is part of every cached view
+        response_cache.invalidate( result[0]["id"] )
 
-        db.close_connection()
+        logging.debug(db.get_query())
 
         return parse_json_response("User updated successfully", 200)
 
@@ -270,7 +280,7 @@ def change_password():
 
     try:
 
-        handle_server()
+        db = get_db()
 
         json_data = request.json
 
@@ -298,13 +308,16 @@ def change_password():
         if not result:
             return parse_json_response( f"User {email} does not exist" , 402 )
 
+        # Password change ends every session of the user
         db.execute_query(
             """ 
-                UPDATE users SET password = ? where email = ?
+                UPDATE users SET password = ?, token = NULL where email = ?
             """,
             ( new_password , email )
         )
 
+        token_cache.invalidate_user( result[0]["id"] )
+
         return parse_json_response("Password changed successfully", 200)
 
     except Exception as e:
@@ -318,7 +331,7 @@ def login():
 
     try:
 
-        handle_server()
+        db = get_db()
 
         json_data = request.json
 
@@ -371,16 +384,13 @@ def login():
 
         import jwt
 
-        # Define a secret key
-        secret_key = "secret"
-
         payload = result[0]
         
         payload["exp"] =  datetime.datetime.utcnow() + datetime.timedelta(hours=1)
 
         logging.debug(payload)
 
-        encoded_jwt = jwt.encode(payload, secret_key, algorithm="HS256")
+        encoded_jwt = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
         
         db.execute_query(
             """ 
@@ -389,6 +399,9 @@ def login():
             ( encoded_jwt , email )
         )
 
+        # The previous token of the user is replaced
+        token_cache.invalidate_user( payload["id"] )
+
         return parse_json_response( 
             {
                 "token": encoded_jwt
@@ -401,36 +414,59 @@ def login():
         
         return parse_json_response( str(e) , 400 )
 
+@app.route("/users/logout", methods=["POST"])
+def logout():
+
+    try:
+
+        db = get_db()
+
+        id_user = get_user_id( request.headers )
+        if id_user is None:
+            return parse_json_response( "Unauthorized" , 401 )
+
+        db.execute_query(
+            """ 
+                UPDATE users SET token = NULL where id = ?
+            """,
+            ( id_user, )
+        )
+
+        token_cache.invalidate_user( id_user )
+
+        return parse_json_response("Logged out successfully", 200)
+
+    except Exception as e:
+
+        logging.debug(e)
+        
+        return parse_json_response( str(e) , 400 )
+
 # =========================
 # TASK CATEGORIES ENDPOINTS
 # =========================
 @app.route("/tasks/categories", methods=["GET", "POST", "PUT", "DELETE"])
 def task_categories():
     try:
-        if not init_connection(db):
-            raise Exception("Database connection failed")
+        db = get_db()
 
         # validar token
-        authorized = check_authorization(request.headers)
-        if not authorized:
-            return parse_json_response("Unauthorized", 401)
-
         # obtener id_user desde token
-        token = request.headers.get("Authorization").split(" ")[1]
-        db.execute_query("SELECT id FROM users WHERE token = ?", (token,))
-        user = db.fetch_all()
-        if not user:
-            raise Exception("User not found")
-        id_user = user[0]["id"]
+        id_user = get_user_id(request.headers)
+        if id_user is None:
+            return parse_json_response("Unauthorized", 401)
 
         # GET → obtener todas las categorías del usuario
         if request.method == "GET":
-            db.execute_query(
-                f"SELECT * FROM categories WHERE id_user = {id_user}"
-            )
-            result = db.fetch_all()
 
-            return parse_json_response(result, 200)
+            def build():
+                db.execute_query(
+                    "SELECT * FROM categories WHERE id_user = ?",
+                    (id_user,),
+                )
+                return parse_json_response(db.fetch_all(), 200)
+
+            return cached_response(id_user, "categories", build)
 
         # POST → crear una categoría
         if request.method == "POST":
@@ -448,6 +484,7 @@ def task_categories():
                 "INSERT INTO tasks_categories (category, content, id_user) VALUES (?, ?, ?)",
                 (category, content_json, id_user),
             )
+            response_cache.invalidate(id_user, "categories")
 
             return parse_json_response("Category created successfully", 201)
 
@@ -466,6 +503,7 @@ def task_categories():
                 "DELETE FROM tasks WHERE id_category = ? AND id_user = ?",
                 (id_category, id_user),
             )
+            response_cache.invalidate(id_user, "categories", "tasks")
             return parse_json_response("Category deleted successfully", 200)
 
     except Exception as e:
@@ -474,68 +512,95 @@ def task_categories():
 # ============
 # TASKS ENDPOINTS
 # ============
+def fetch_tasks_after(db, id_user, id_category, after, count):
+
+    """
+    Keyset page of a category, newest first: `count` tasks after the (created_at, id)
+    cursor. Each query seeks idx_tasks_user_category_created, so any page costs the same.
+    Tasks without created_at sort last, by id.
+    """
+    rows = []
+    if after is None or after[0] is not None:
+        range_filter, params = "", (id_user, id_category)
+        if after is not None:
+            range_filter, params = "AND (lt.created_at, lt.id) < (?, ?)", params + after
+        db.execute_query(
+            f"""SELECT *
+                FROM list_tasks lt
+                WHERE lt.id_user = ? AND lt.id_category = ? AND lt.created_at IS NOT NULL {range_filter}
+                ORDER BY lt.created_at DESC, lt.id DESC
+                LIMIT ?""",
+            params + (count,),
+        )
+        rows = db.fetch_all()
+        if len(rows) == count:
+            return rows
+
+    # Cursor already inside the undated tail: continue after its id, otherwise start at the top
+    last_id = after[1] if after is not None and after[0] is None else 2**63 - 1
+    db.execute_query(
+        """SELECT *
+           FROM list_tasks lt
+           WHERE lt.id_user = ? AND lt.id_category = ? AND lt.created_at IS NULL AND lt.id < ?
+           ORDER BY lt.id DESC
+           LIMIT ?""",
+        (id_user, id_category, last_id, count - len(rows)),
+    )
+    return rows + db.fetch_all()
+
 @app.route("/tasks", methods=["GET", "POST", "PUT", "DELETE"])
 def tasks():
     try:
-        if not init_connection(db):
-            raise Exception("Database connection failed")
-
-        authorized = check_authorization(request.headers)
-        if not authorized:
-            return parse_json_response("Unauthorized", 401)
+        db = get_db()
 
         # obtener id_user desde token
-        token = request.headers.get("Authorization").split(" ")[1]
-        db.execute_query("SELECT id FROM users WHERE token = ?", (token,))
-        user = db.fetch_all()
-        if not user:
-            raise Exception("User not found")
-        id_user = user[0]["id"] 
+        id_user = get_user_id(request.headers)
+        if id_user is None:
+            return parse_json_response("Unauthorized", 401)
 
         # GET → obtener todas las tareas del usuario
         if request.method == "GET":
             id_category = request.args.get("id_category", None)
             print("id_category:", id_category)  # Debugging line
-            if id_category:
-                print("Category specified, fetching tasks for category:", id_category)
-                page = request.args.get("page", None)
-                print("Pagination parameter:", page)  # Debugging line
-                limit = request.args.get("limit", None)
-                print("Limit parameter:", limit)  # Debugging line
-                    # Mostrar todas las tareas de la categoría especificada
-                if page and limit:
-                    offset = (int(page) - 1) * int(limit)
+
+            def build():
+                if id_category:
+                    print("Category specified, fetching tasks for category:", id_category)
+                    limit = page_size(request.args.get("limit", None))
+                    cursor = request.args.get("cursor", None)
+                    page = request.args.get("page", None)
+                    if page and not cursor:
+                        # Numbered pages (Pagination component): OFFSET, bounded by MAX_PAGE_SIZE
+                        offset = (max(int(page), 1) - 1) * limit
+                        db.execute_query(
+                            """SELECT *
+                               FROM list_tasks lt
+                               WHERE lt.id_user = ? AND lt.id_category = ?
+                               ORDER BY lt.created_at DESC, lt.id DESC
+                               LIMIT ? OFFSET ?""",
+                            (id_user, id_category, limit + 1, offset),
+                        )
+                        rows = db.fetch_all()
+                    else:
+                        rows = fetch_tasks_after(db, id_user, id_category, decode_cursor(cursor) if cursor else None, limit + 1)
+                    result, cursor = paginate(rows, limit)
+                    return parse_json_response(result, 200, next_cursor=cursor)
+                else:
+                    # Mostrar solo las 3 tareas de hoy del usuario
+                    print("No category specified, fetching today's tasks.")
                     db.execute_query(
                         """SELECT *
                            FROM list_tasks lt
-                           WHERE lt.id_user = ? AND lt.id_category = ?
+                           WHERE lt.id_user = ?
+                           --AND date(lt.created_at) = date('now','localtime')
                            ORDER BY lt.created_at DESC
-                           LIMIT ? OFFSET ?""",
-                        (id_user, id_category, int(limit), offset),
+                           LIMIT 3""",
+                        (id_user,),
                     )
-                else:
-                    db.execute_query(
-                        """SELECT *
-                           FROM list_tasks lt
-                           WHERE lt.id_user = ? AND lt.id_category = ?""",
-                        (id_user, id_category),
-                )
-                result = db.fetch_all()
-                return parse_json_response(result, 200)
-            else:
-                # Mostrar solo las 3 tareas de hoy del usuario
-                print("No category specified, fetching today's tasks.")
-                db.execute_query(
-                    """SELECT *
-                       FROM list_tasks lt
-                       WHERE lt.id_user = ?
-                       --AND date(lt.created_at) = date('now','localtime')
-                       ORDER BY lt.created_at DESC
-                       LIMIT 3""",
-                    (id_user,),
-                )
-                result = db.fetch_all()
-                return parse_json_response(result, 200)
+                    result = db.fetch_all()
+                    return parse_json_response(result, 200)
+
+            return cached_response(id_user, "tasks", build)
 
         # POST → crear nueva tarea
         if request.method == "POST":
@@ -566,6 +631,7 @@ def tasks():
                 """,
                 (title, description, id_category, created_at, updated_at, state, id_user, icon, color)
             )
+            response_cache.invalidate(id_user, "tasks", "categories")
 
             return parse_json_response("Task created successfully", 201)
 
@@ -599,6 +665,7 @@ def tasks():
                 """,
                 (title, description, state, updated_at, id_task, id_user)
             )
+            response_cache.invalidate(id_user, "tasks", "categories")
 
             return parse_json_response("Task updated successfully", 200)
 
@@ -610,9 +677,10 @@ def tasks():
                 raise Exception("Task ID required")
 
             db.execute_query(
-                "DELETE FROM tasks WHERE id = ?",
-                (id_task,),
+                "DELETE FROM tasks WHERE id = ? AND id_user = ?",
+                (id_task, id_user),
             )
+            response_cache.invalidate(id_user, "tasks", "categories")
             return parse_json_response("Task deleted successfully", 200)
 
     except Exception as e:
@@ -621,33 +689,27 @@ def tasks():
 @app.route("/games/scores", methods=["GET", "PUT"])
 def scores():
     try:
-        if not init_connection(db):
-            raise Exception("Database connection failed")
-
-        authorized = check_authorization(request.headers)
-        if not authorized:
-            return parse_json_response("Unauthorized", 401)
+        db = get_db()
 
         # obtener id_user desde token
-        token = request.headers.get("Authorization").split(" ")[1]
-        db.execute_query("SELECT id FROM users WHERE token = ?", (token,))
-        user = db.fetch_all()
-        if not user:
-            raise Exception("User not found")
-        id_user = user[0]["id"] 
+        id_user = get_user_id(request.headers)
+        if id_user is None:
+            return parse_json_response("Unauthorized", 401)
         id_game = request.args.get("id", 0)
 
         # GET → obtener todas las tareas del usuario
         if request.method == "GET":
 
-            if id_game == 0:
-                db.execute_query("SELECT * from game_scores_view WHERE user_id = ?", (id_user,))
-            else:
-                db.execute_query("SELECT * from game_scores_view WHERE user_id = ? and game_id = ?", (id_user,id_game,))
+            def build():
+                if id_game == 0:
+                    db.execute_query("SELECT * from game_scores_view WHERE user_id = ?", (id_user,))
+                else:
+                    db.execute_query("SELECT * from game_scores_view WHERE user_id = ? and game_id = ?", (id_user,id_game,))
+
+                scores = db.fetch_all()
+                return parse_json_response(scores, 201)
 
-                
-            scores = db.fetch_all()
-            return parse_json_response(scores, 201)
+            return cached_response(id_user, "scores", build)
 
         # PUT → actualizar tarea
         if request.method == "PUT":
@@ -670,6 +732,7 @@ def scores():
             db.execute_query("UPDATE game_scores SET prestige = ?, level = ?, lines_cleared = ?, duration_seconds = ?, score = ?, played_at = ? WHERE game_id = ? and user_id = ?",
                 ( prestige, level ,lines_cleared, time_elapsed, score, last_played, id_game, id_user )
             )
+            response_cache.invalidate(id_user, "scores")
 
             return parse_json_response("Progress saved", 201)
 
@@ -681,9 +744,11 @@ if __name__ == "__main__":
     port = 5000
     try:
         # initialize DB before running server
-        handle_server()
+        database = handle_server()
+
+        if init_tables( database ) == False: raise Exception("❌ unable intializing tables in database")
 
-        if init_tables( db ) == False: raise Exception("❌ unable intializing tables in database")
+        database.close_connection()
         
         print(f"Server is running and listening to {host}:{port}")
 
@@ -1,23 +1,95 @@
 import sqlite3 as sql
+import queue
+import threading
 
 import os
 
 DB_PATH = os.path.join(os.path.dirname(__file__) , "omnimind.db")
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 8))
+
+class ConnectionPool:
+
+    """
+    Bounded pool of SQLite connections shared by the request threads:
+    a request borrows one connection and gives it back on teardown.
+    """
+
+    def __init__(self, db_path=DB_PATH, size=POOL_SIZE, timeout=10.0):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.connections = queue.LifoQueue(maxsize=size)
+        self.created = 0
+        self.lock = threading.Lock()
+
+    def new_connection(self):
+        # Borrowed by a different thread on every request
+        conn = sql.connect(self.db_path, check_same_thread=False, timeout=self.timeout)
+        conn.row_factory = sql.Row
+        conn.execute("PRAGMA journal_mode=WAL;").fetchall() # readers don't block the writer
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        return conn
+
+    def acquire(self):
+        try:
+            return self.connections.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            if self.created < self.size:
+                self.created += 1
+                try:
+                    return self.new_connection()
+                except sql.Error:
+                    self.created -= 1
+                    raise
+
+        try:
+            return self.connections.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sql.OperationalError(f"No database connection available after {self.timeout}s")
+
+    def release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        self.connections.put_nowait(conn)
+
+    def close_all(self):
+        while True:
+            try:
+                self.connections.get_nowait().close()
+            except queue.Empty:
+                break
+        self.created = 0
+
+pool = ConnectionPool()
 
 class Database:
 
-    def __init__(self, db_path=DB_PATH):
+    def __init__(self, db_path=DB_PATH, conn=None):
         self.db_path = db_path
-        self.conn = None
-        self.cursor = None
+        self.conn = conn
+        self.cursor = conn.cursor() if conn is not None else None # one cursor per request, never shared
         self.query = None
+        self.pooled = conn is not None
 
-    def get_db(self,g):
+    @staticmethod
+    def get_db(g):
+        """
+        Request-scoped Database on a pooled connection, stored in flask.g
+        and given back by release_db() on app.teardown_appcontext.
+        """
         if "db" not in g:
-            g.db = sql.connect(DB_PATH, check_same_thread=False)
-            g.db.row_factory = sql.Row
+            g.db = Database(conn=pool.acquire())
         return g.db
 
+    @staticmethod
+    def release_db(g):
+        database = g.pop("db", None)
+        if database is not None:
+            database.close_connection()
+
     def conect_DB(self):
         try:
             self.conn = sql.connect(self.db_path, check_same_thread=False)
@@ -68,7 +140,15 @@ class Database:
         return results
 
     def close_connection(self):
-        self.conn.close()
+        if self.conn is None:
+            return
+        if self.pooled:
+            self.cursor.close()
+            pool.release(self.conn)
+        else:
+            self.conn.close()
+        self.conn = None
+        self.cursor = None
 
     def get_query(self):
         
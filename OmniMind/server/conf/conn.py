@@ -3,7 +3,7 @@ from conf.DB import Database
 import os
 
 from dotenv import load_dotenv
-from helpers.utils import get_queries
+from helpers.utils import get_queries, get_migrations
 
 load_dotenv()
 
@@ -26,33 +26,70 @@ def init_connection( db ):
 
         return False
 
+def add_missing_columns( conn, table, columns ):
+
+    existing = { row[1] for row in conn.execute(f"PRAGMA table_info({table})") }
+
+    for column, definition in columns.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+def run_migrations( db ):
+
+    """
+    Apply the migrations newer than PRAGMA user_version, each one in its own
+    transaction together with its version bump: a failed step leaves the database
+    on the previous version, and an up to date database runs nothing on boot.
+    """
+    conn = db.conn
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+
+    for version, description, steps in get_migrations():
+
+        if version <= current:
+            continue
+
+        try:
+
+            # IMMEDIATE: a second process booting at the same time waits instead of migrating twice
+            conn.execute("BEGIN IMMEDIATE")
+
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= version:
+                conn.rollback()
+                continue
+
+            for step in steps:
+                if isinstance(step, tuple):
+                    add_missing_columns( conn, *step )
+                else:
+                    conn.execute(step)
+
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+
+        except sql.Error:
+
+            conn.rollback()
+            raise
+
+        print(f"✅ Applied migration {version}: {description}")
+
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
 def init_tables( db ):
     
     try:
 
         if db.conn:
 
-            if ( db.execute_query( get_queries()["create_roles_table"] ) ):
-                print("✅ Created roles table successfully")
-            
+            print(f"✅ Schema at version {run_migrations( db )}")
+
             if ( db.execute_query( get_queries()["init_roles_data"] ) ):
                 print("✅ Init dumped roles data from roles table")
             
-            if ( db.execute_query( get_queries()["create_users_table"] ) ):
-                print("✅ Created users table successfully")
-            
-            if ( db.execute_query( get_queries()["init_user_admin_data"] , ( user_admin , email_admin, password_admin ) ) ):
+            if ( db.execute_query( get_queries()["init_user_admin_data"] , ( user_admin , email_admin, password_admin, email_admin ) ) ):
                 print("✅ Init dumped admin user data from users table")
             
-            if ( db.execute_query( get_queries()["create_tasks_categories_table"] ) ):
-                print("✅ Created tasks categories table successfully")
-
-            if ( db.execute_query( get_queries()["create_tasks_table"] ) ):
-                print("✅ Created tasks table successfully")
-
-            if ( db.execute_query( get_queries()["create_games_table"] ) ):
-                print("✅ Created games table successfully")
-            
             if ( db.execute_query( get_queries()["init_games_data"] ) ):
                 print("✅ Init dumped game data from games successfully")
 
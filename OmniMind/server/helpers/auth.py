@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
+
+# Used by /users/login to sign and by verify_token to check: the only copy of the key in this server.
+# This module is duplicated on purpose in OmniMind/server and pronostico_ventas/server,
+# which are deployed separately; keep both copies identical.
+SECRET_KEY = "secret"
+ALGORITHM = "HS256"
+
+class TokenCache:
+
+    """
+    Bounded token -> user_id cache. Entries live `ttl` seconds at most and never
+    past the token's own exp; the least recently used entry is evicted when full.
+    Per process: other workers pick up a revocation once their entry expires.
+    """
+
+    def __init__(self, max_size=10000, ttl=300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict() # token -> (user_id, expires_at)
+        self.lock = threading.Lock()
+
+    def get(self, token):
+        with self.lock:
+            entry = self.entries.get(token)
+            if entry is None:
+                return None
+            user_id, expires_at = entry
+            if expires_at <= time.time():
+                del self.entries[token]
+                return None
+            self.entries.move_to_end(token)
+            return user_id
+
+    def set(self, token, user_id, exp=None):
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        with self.lock:
+            self.entries[token] = (user_id, expires_at)
+            self.entries.move_to_end(token)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate_token(self, token):
+        with self.lock:
+            self.entries.pop(token, None)
+
+    def invalidate_user(self, user_id):
+        # login / logout / password change: drop every cached token of the user
+        with self.lock:
+            for token in [t for t, (uid, _) in self.entries.items() if uid == user_id]:
+                del self.entries[token]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+token_cache = TokenCache()
+
+def get_token(headers):
+
+    auth_header = headers.get("Authorization", None)
+    if not auth_header or "Bearer" not in auth_header:
+        return None
+
+    parts = auth_header.split(" ")
+    return parts[1] if len(parts) > 1 and parts[1] else None
+
+def verify_token(token, get_db):
+
+    """
+    user_id of a valid token, None otherwise.
+    Hot path: cache hit, get_db() is not even called. Miss: signature and exp are checked
+    in-process, then one primary key lookup confirms it is still the user's current token.
+    """
+    if not token:
+        return None
+
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.InvalidTokenError:
+        return None
+
+    db = get_db()
+    db.execute_query(
+        """
+            SELECT id from users where id = ? and token = ?
+        """,
+        ( payload.get("id"), token )
+    )
+
+    result = db.fetch_all()
+    if not result:
+        return None
+
+    user_id = result[0]["id"]
+    token_cache.set(token, user_id, payload.get("exp"))
+    return user_id
@@ -0,0 +1,56 @@
+import base64
+import binascii
+import json
+
+# Page size of GET /tasks when the client sends no limit, and the most it can ask for
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+def page_size( limit ):
+
+    if limit is None or limit == "":
+        return DEFAULT_PAGE_SIZE
+
+    try:
+        limit = int(limit)
+    except ( TypeError, ValueError ):
+        raise ValueError("limit must be an integer")
+
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+def encode_cursor( created_at, id_row ):
+
+    """
+    Opaque cursor pointing after the row (created_at, id): clients pass it back as is.
+    """
+    raw = json.dumps([created_at, id_row], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor( cursor ):
+
+    """
+    (created_at, id) of an encode_cursor() value; ValueError if it was tampered with.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id_row = json.loads(raw)
+    except ( binascii.Error, UnicodeDecodeError, ValueError, TypeError ):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(id_row, int) or not ( created_at is None or isinstance(created_at, str) ):
+        raise ValueError("Invalid cursor")
+
+    return created_at, id_row
+
+def paginate( rows, limit ):
+
+    """
+    Rows were fetched with LIMIT limit + 1: the extra row only tells whether
+    there is a next page. Returns the page and its next cursor (None on the last page).
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last["created_at"], last["id"])
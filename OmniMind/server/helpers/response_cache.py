@@ -0,0 +1,82 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+
+# Kinds of cached responses, invalidated separately
+SCOPES = ("categories", "tasks", "scores")
+
+class CachedResponse:
+
+    __slots__ = ("body", "etag", "last_modified", "expires_at")
+
+    def __init__(self, body, expires_at):
+        self.body = body
+        # Content hash: a rebuilt but unchanged response keeps its ETag (clients still get 304)
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self.expires_at = expires_at
+
+class ResponseCache:
+
+    """
+    Serialized GET responses per (user, scope, url), so a repeated screen load
+    skips the query and the JSON encoding. Writes drop the user's stale scopes
+    (write-through invalidation); `ttl` bounds how stale other workers can be.
+    The least recently used entry is evicted when full.
+
+    Every invalidation bumps the user's generation: a response computed from data
+    read before a write must not be stored after that write invalidated the user, so
+    set() only stores it if the generation is still the one taken before computing.
+    """
+
+    def __init__(self, max_size=5000, ttl=300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict() # (user_id, scope, url) -> CachedResponse
+        self.generations = {} # user_id -> number of invalidations
+        self.lock = threading.Lock()
+
+    def generation(self, user_id):
+        with self.lock:
+            return self.generations.get(user_id, 0)
+
+    def get(self, user_id, scope, url):
+        key = (user_id, scope, url)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(self, user_id, scope, url, body, generation):
+        entry = CachedResponse(body, time.time() + self.ttl)
+        key = (user_id, scope, url)
+        with self.lock:
+            if self.generations.get(user_id, 0) != generation:
+                # Invalidated while computing: serve it this once, never cache it
+                return entry
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, user_id, *scopes):
+        # No scopes: everything cached for the user
+        scopes = scopes or SCOPES
+        with self.lock:
+            self.generations[user_id] = self.generations.get(user_id, 0) + 1
+            for key in [k for k in self.entries if k[0] == user_id and k[1] in scopes]:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+response_cache = ResponseCache()
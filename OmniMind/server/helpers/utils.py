@@ -3,12 +3,6 @@ def get_queries():
     try:
         
         return { 
-            "create_roles_table": """
-                CREATE TABLE IF NOT EXISTS roles ( 
-                    id INTEGER PRIMARY KEY AUTOINCREMENT, 
-                    role TEXT NOT NULL
-                )
-            """,
             "init_roles_data": """
                 INSERT OR IGNORE INTO roles (role)
                     SELECT 'admin'
@@ -17,7 +11,40 @@ def get_queries():
                     SELECT 'user'
                     WHERE NOT EXISTS (SELECT 1 FROM roles WHERE role = 'user')
             """,
-            "create_users_table": """ 
+            "init_user_admin_data": """
+                INSERT OR IGNORE INTO users (username, email, password, role)
+                    SELECT ?, ?, ?, 1
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM users WHERE email = ?
+                    )
+            """,
+            "init_games_data": """
+                    INSERT OR IGNORE INTO games (name, path, icon_name, alias)
+                    VALUES
+                        ('RandomNumber', '/games/random_number', 'gameRandomNumber', 'Random number'),
+                        ('Tetris', '/games/tetris', 'tetris', 'Tetris'),
+                        ('Chess', '/games/chess', 'chess', 'Chess');
+                    """
+        }
+
+    except ( KeyError, TypeError ):
+        return False
+def get_migrations():
+
+    """
+    Schema history, applied in order by conf.conn.run_migrations and tracked in PRAGMA user_version.
+    Never edit a released version: append a new one.
+    Each step is a SQL statement or a ( table, { column: definition } ) pair of columns to add if missing.
+    """
+    return [
+        ( 1, "base tables", [
+            """
+                CREATE TABLE IF NOT EXISTS roles ( 
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, 
+                    role TEXT NOT NULL
+                )
+            """,
+            """ 
                 CREATE TABLE IF NOT EXISTS users (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     email TEXT NOT NULL, 
@@ -28,14 +55,7 @@ def get_queries():
                     FOREIGN KEY (role) REFERENCES roles(id) ON DELETE CASCADE
                 )
             """,
-            "init_user_admin_data": """
-                INSERT OR IGNORE INTO users (username, email, password, role)
-                    SELECT ?, ?, ?, 1
-                    WHERE NOT EXISTS (
-                        SELECT 1 FROM users WHERE email = 'ivanartista96@gmail.com'
-                    )
-            """,
-            "create_tasks_categories_table": """ 
+            """ 
                 CREATE TABLE IF NOT EXISTS tasks_categories (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     category TEXT NOT NULL, 
@@ -44,32 +64,165 @@ def get_queries():
                     FOREIGN KEY (id_user) REFERENCES users(id) ON DELETE CASCADE
                 )
             """,
-            "create_tasks_table": """ 
+            """ 
                 CREATE TABLE IF NOT EXISTS tasks (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    content JSON NOT NULL, 
                     id_category INTEGER,
                     id_user INTEGER,
                     state INTEGER NOT NULL DEFAULT 0,
+                    title TEXT NOT NULL DEFAULT '',
+                    description TEXT,
+                    created_at DATETIME,
+                    updated_at DATETIME,
+                    icon TEXT,
+                    color TEXT,
                     FOREIGN KEY (id_category) REFERENCES tasks_categories(id) ON DELETE CASCADE,
                     FOREIGN KEY (id_user) REFERENCES users(id) ON DELETE CASCADE
                 )
             """,
-            "create_games_table": """
-                create table if not exists games
-                (
-                    id  INTEGER  primary key autoincrement not null,
-                    name VARCHAR(50) not null
+            """
+                CREATE TABLE IF NOT EXISTS games (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+                    name VARCHAR(50) NOT NULL,
+                    path TEXT,
+                    icon_name TEXT,
+                    alias TEXT
                 )
             """,
-            "init_games_data": """
-                    INSERT OR IGNORE INTO games (name )
-                    VALUES
-                        ('RandomNumber'),
-                        ('Tetris'),
-                        ('Chess');
-                    """
-        }
-
-    except ( KeyError, TypeError ):
-        return False
\ No newline at end of file
+            """
+                CREATE TABLE IF NOT EXISTS game_scores (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    game_id INTEGER NOT NULL,
+                    level INTEGER DEFAULT 1,
+                    score INTEGER DEFAULT 0,
+                    prestige INTEGER DEFAULT 1,
+                    lines_cleared INTEGER DEFAULT 0,
+                    duration_seconds INTEGER DEFAULT 0,
+                    difficulty VARCHAR(20) DEFAULT 'normal',
+                    device VARCHAR(50) DEFAULT 'desktop',
+                    played_at DATETIME DEFAULT NULL,
+                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                    FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE
+                )
+            """,
+        ] ),
+        # Databases created before the tasks/games columns existed
+        ( 2, "tasks and games columns", [
+            ( "tasks", {
+                "title": "TEXT NOT NULL DEFAULT ''",
+                "description": "TEXT",
+                "created_at": "DATETIME",
+                "updated_at": "DATETIME",
+                "icon": "TEXT",
+                "color": "TEXT",
+            } ),
+            ( "games", {
+                "path": "TEXT",
+                "icon_name": "TEXT",
+                "alias": "TEXT",
+            } ),
+        ] ),
+        ( 3, "views", [
+            "DROP VIEW IF EXISTS categories",
+            """
+                CREATE VIEW categories AS
+                SELECT
+                    tc.id_user,
+                    tc.id,
+                    tc.category,
+                    tc.content,
+                    ( SELECT COUNT(*) FROM tasks t WHERE tc.id = t.id_category ) AS tasks,
+                    ( SELECT u.username FROM users u WHERE u.id = tc.id_user ) AS username
+                FROM tasks_categories tc
+            """,
+            "DROP VIEW IF EXISTS list_tasks",
+            """
+                CREATE VIEW list_tasks AS
+                SELECT
+                    id,
+                    title,
+                    description,
+                    icon,
+                    color,
+                    id_category,
+                    created_at,
+                    updated_at,
+                    state,
+                    id_user,
+                    ( SELECT users.username FROM users WHERE users.id = id_user ) AS autor
+                FROM tasks
+            """,
+            "DROP VIEW IF EXISTS game_scores_view",
+            """
+                CREATE VIEW game_scores_view AS
+                SELECT
+                    u.id,
+                    u.username,
+                    gs.user_id,
+                    gs.game_id,
+                    gs.prestige,
+                    g.name,
+                    g.path AS path,
+                    g.alias AS alias,
+                    g.icon_name AS icon_name,
+                    gs.lines_cleared AS lines_cleared,
+                    gs.score AS score,
+                    gs.level AS level,
+                    gs.duration_seconds AS duration,
+                    gs.played_at AS last_played
+                FROM game_scores gs
+                LEFT JOIN games g ON gs.game_id = g.id
+                LEFT JOIN users u ON gs.user_id = u.id
+            """,
+            # || instead of CONCAT(), which needs SQLite 3.44+
+            "DROP VIEW IF EXISTS tasks_completed",
+            """
+                CREATE VIEW tasks_completed AS
+                WITH total_tasks AS (
+                    SELECT id_category, COUNT(id) AS total_
+                    FROM tasks
+                    GROUP BY id_category
+                ),
+                progress_task AS (
+                    SELECT id_category, SUM(CASE WHEN state = 1 THEN 1 ELSE 0 END) AS progress_
+                    FROM tasks
+                    GROUP BY id_category
+                )
+                SELECT
+                    t.id_category,
+                    t.id_user,
+                    p.progress_ || '/' || t_.total_ AS progress_completed,
+                    ((p.progress_) * 1.0 / t_.total_) * 100 || '%' AS percentage_completed
+                FROM tasks t
+                JOIN progress_task p ON p.id_category = t.id_category
+                JOIN total_tasks t_ ON t_.id_category = t.id_category
+                GROUP BY t.id_category
+            """,
+        ] ),
+        ( 4, "indexes", [
+            # Redundant with the INTEGER PRIMARY KEY, only slowed down writes
+            "DROP INDEX IF EXISTS idx_users_id",
+            "DROP INDEX IF EXISTS idx_categories_id",
+            # token check on a cache miss, login / register lookups
+            "CREATE INDEX IF NOT EXISTS idx_users_token ON users(token)",
+            "CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)",
+            # GET /tasks/categories
+            "CREATE INDEX IF NOT EXISTS idx_tasks_categories_user ON tasks_categories(id_user)",
+            # GET /tasks: filter by user (and category), newest first
+            "CREATE INDEX IF NOT EXISTS idx_tasks_user_category_created ON tasks(id_user, id_category, created_at)",
+            # init_games_data is INSERT OR IGNORE
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_games_name ON games(name)",
+            # One score row per user and game (register inserts them with INSERT OR IGNORE);
+            # duplicates are identical, the score update writes all of them
+            """
+                DELETE FROM game_scores
+                WHERE id NOT IN ( SELECT MIN(id) FROM game_scores GROUP BY user_id, game_id )
+            """,
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_game_scores_user_game ON game_scores(user_id, game_id)",
+        ] ),
+        ( 5, "tasks count index", [
+            # categories view: per-category COUNT(*) of tasks (older databases already have it)
+            "CREATE INDEX IF NOT EXISTS idx_tasks_category_user_state ON tasks(id_category, id_user, state)",
+        ] ),
+    ]
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The server modules are imported top-level (from conf.DB import ..., from helpers...)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
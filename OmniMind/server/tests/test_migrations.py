@@ -0,0 +1,32 @@
+import sqlite3 as sql
+
+from conf.DB import Database
+from conf.conn import run_migrations
+from helpers.utils import get_migrations
+
+
+def migrated(path):
+
+    db = Database(str(path))
+    db.conect_DB()
+    run_migrations(db)
+    return db
+
+
+def test_migrations_are_idempotent(tmp_path):
+
+    db = migrated(tmp_path / "omnimind.db")
+    latest = get_migrations()[-1][0]
+    assert run_migrations(db) == latest
+    db.close_connection()
+
+
+def test_categories_task_count_uses_index(tmp_path):
+
+    db = migrated(tmp_path / "omnimind.db")
+    plan = db.conn.execute("EXPLAIN QUERY PLAN SELECT * FROM categories WHERE id_user = ?", (1,)).fetchall()
+    details = [row[3] for row in plan]
+
+    assert any("USING COVERING INDEX idx_tasks_category_user_state (id_category=?)" in d for d in details), details
+    assert not any(d.startswith("SCAN t") for d in details), details
+    db.close_connection()
@@ -0,0 +1,62 @@
+import sqlite3 as sql
+
+import pytest
+
+import conf.DB as DB
+from conf.conn import run_migrations
+from helpers.response_cache import ResponseCache, response_cache
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+
+    path = str(tmp_path / "omnimind.db")
+    db = DB.Database(path)
+    db.conect_DB()
+    run_migrations(db)
+    db.close_connection()
+
+    monkeypatch.setattr(DB, "pool", DB.ConnectionPool(path))
+    import app
+    monkeypatch.setattr(app, "get_user_id", lambda headers: 1)
+    response_cache.clear()
+    yield app.app.test_client(), path
+    DB.pool.close_all()
+
+
+def test_set_skips_a_response_computed_before_an_invalidation():
+
+    cache = ResponseCache()
+    generation = cache.generation(1)
+    cache.invalidate(1, "tasks") # a write lands between compute and set
+    cache.set(1, "tasks", "/tasks", b"stale", generation)
+
+    assert cache.get(1, "tasks", "/tasks") is None
+
+
+def test_write_during_compute_is_not_cached_stale(client, monkeypatch):
+
+    client, path = client
+    fetch_all = DB.Database.fetch_all
+    interleaved = []
+
+    def fetch_then_write(self):
+        rows = fetch_all(self)
+        if not interleaved:
+            # Concurrent POST /tasks/categories: commit, then invalidate
+            interleaved.append(True)
+            conn = sql.connect(path)
+            conn.execute("INSERT INTO tasks_categories (category, content, id_user) VALUES ('new', '{}', 1)")
+            conn.commit()
+            conn.close()
+            response_cache.invalidate(1, "categories")
+        return rows
+
+    monkeypatch.setattr(DB.Database, "fetch_all", fetch_then_write)
+
+    first = client.get("/tasks/categories")
+    assert first.get_json()["message"] == []
+
+    second = client.get("/tasks/categories", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert [c["category"] for c in second.get_json()["message"]] == ["new"]
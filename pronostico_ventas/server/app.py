@@ -11,6 +11,7 @@ import os
 
 from dotenv import load_dotenv
 from helpers.utils import get_queries
+from helpers.auth import get_token, verify_token, token_cache, SECRET_KEY, ALGORITHM
 from conf.conn import init_connection, init_tables
 
 import datetime
@@ -38,38 +39,14 @@ def parse_json_response( message , status = 200 ):
             status=status
         )
     
-def check_authorization(headers):
-    
-    try:
-    
-        auth_header = headers.get("Authorization", None)
-        if not auth_header:
-            return False
-
-        if "Bearer" not in auth_header:
-            return False
-        
-        # Obtain token
-        token = auth_header.split(" ")[1]
-        if not token:
-            return False
+def get_user_id(headers):
 
-        # Validate token
-        db.execute_query(
-            """
-                SELECT * from users where token = ?
-            """,
-            (token,)
-        )
+    # Authenticated user id from the Bearer token (cached), None if missing or invalid
+    return verify_token( get_token(headers), lambda: db )
 
-        result = db.fetch_all()
-        if not result:
-            return False
+def check_authorization(headers):
 
-        return True
-    
-    except IndexError:
-        return False
+    return get_user_id(headers) is not None
 
 # Define routes outside of __main__ block
 @app.route("/roles", methods=["GET"])
@@ -226,6 +203,8 @@ def update():
             ( username , email,  password )
         )
 
+        token_cache.invalidate_user( result[0]["id"] )
+
         logging.debug(db.get_query())
 
         db.close_connection()
@@ -271,13 +250,16 @@ def change_password():
         if not result:
             return parse_json_response( f"User {email} does not exist" , 402 )
 
+        # Password change ends every session of the user
         db.execute_query(
             """ 
-                UPDATE users SET password = ? where email = ?
+                UPDATE users SET password = ?, token = NULL where email = ?
             """,
             ( new_password , email )
         )
 
+        token_cache.invalidate_user( result[0]["id"] )
+
         return parse_json_response("Password changed successfully", 200)
 
     except Exception as e:
@@ -344,16 +326,13 @@ def login():
 
         import jwt
 
-        # Define a secret key
-        secret_key = "secret"
-
         payload = result[0]
         
         payload["exp"] =  datetime.datetime.utcnow() + datetime.timedelta(hours=1)
 
         logging.debug(payload)
 
-        encoded_jwt = jwt.encode(payload, secret_key, algorithm="HS256")
+        encoded_jwt = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
         
         db.execute_query(
             """ 
@@ -362,6 +341,9 @@ def login():
             ( encoded_jwt , email )
         )
 
+        # The previous token of the user is replaced
+        token_cache.invalidate_user( payload["id"] )
+
         return parse_json_response( 
             {
                 "token": encoded_jwt
@@ -374,6 +356,34 @@ def login():
         
         return parse_json_response( str(e) , 400 )
 
+@app.route("/users/logout", methods=["POST"])
+def logout():
+
+    try:
+
+        handle_server()
+
+        id_user = get_user_id( request.headers )
+        if id_user is None:
+            return parse_json_response( "Unauthorized" , 401 )
+
+        db.execute_query(
+            """ 
+                UPDATE users SET token = NULL where id = ?
+            """,
+            ( id_user, )
+        )
+
+        token_cache.invalidate_user( id_user )
+
+        return parse_json_response("Logged out successfully", 200)
+
+    except Exception as e:
+
+        logging.debug(e)
+        
+        return parse_json_response( str(e) , 400 )
+
 if __name__ == "__main__":
     
     host = "0.0.0.0"